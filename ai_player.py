@@ -1,21 +1,105 @@
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from bitboard import Bitboard, CLASSIC
+from iterative_search import IterativeDeepeningEngine
+from mcts import MCTSEngine
+from negamax import NegamaxEngine
+import lookup_table
+
+# Single background worker shared by every AIPlayer so searches never run on
+# the render thread and never overlap each other
+_executor = None
+
+
+def _get_executor():
+    """Return the shared worker used for background move searches."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ai-move')
+    return _executor
+
+
+class MoveRequest:
+    """
+    Handle for a move being computed in the background.
+    The move only becomes available once both the search has finished and
+    the minimum thinking time has elapsed, so the "AI Thinking..." status
+    stays visible without blocking the frame loop.
+    """
+    def __init__(self, future, min_think_time, stop_event=None):
+        self._future = future
+        self._ready_at = time.monotonic() + min_think_time
+        self._stop_event = stop_event
+        self.cancelled = False
+    
+    def done(self):
+        """Check if the move is ready to be applied."""
+        if self.cancelled or not self._future.done():
+            return False
+        return time.monotonic() >= self._ready_at
+    
+    def result(self):
+        """Return the chosen move (row, col), or None if there is none."""
+        return self._future.result()
+    
+    def cancel(self):
+        """Discard this request; its result will never be reported as done."""
+        self.cancelled = True
+        self._future.cancel()
+        # Ask a search that is already running to stop early
+        if self._stop_event is not None:
+            self._stop_event.set()
+
 
 class AIPlayer:
-    def __init__(self, difficulty='medium'):
+    # Shared by every AIPlayer so its transposition table survives between
+    # moves, games and difficulty changes
+    engine = NegamaxEngine()
+    # Memory-mapped best moves for every position; None if it couldn't be loaded
+    lookup = lookup_table.load()
+    # Time-bounded engines for larger boards, one per Geometry
+    deep_engines = {}
+    # Process-pool Monte Carlo search, started the first time it is used
+    mcts_engine = None
+    
+    def __init__(self, difficulty='medium', think_time=0.5, time_budget=1.0, mcts_playouts=None):
         self.difficulty = difficulty
+        # Minimum time a move takes, so it seems like the AI is thinking
+        self.think_time = think_time
+        # Maximum search time per move on boards larger than 3x3 (and for
+        # 'mcts' when no playout budget is given)
+        self.time_budget = time_budget
+        # Total random playouts per move for 'mcts'; overrides time_budget
+        self.mcts_playouts = mcts_playouts
     
     def make_move(self, board):
-        """Make a move based on the current board state."""
+        """Make a move based on the current board state (blocking)."""
         # Add a small delay to make it seem like the AI is thinking
-        time.sleep(0.5)
+        time.sleep(self.think_time)
+        return self.choose_move(board)
+    
+    def request_move(self, board):
+        """
+        Start searching for a move in the background.
+        Returns a MoveRequest that can be polled with done() every frame and
+        cancelled if the game is restarted before the move arrives.
+        """
+        stop_event = threading.Event()
+        future = _get_executor().submit(self.choose_move, self._to_bitboard(board), stop_event.is_set)
+        return MoveRequest(future, self.think_time, stop_event)
+    
+    def choose_move(self, board, should_stop=None):
+        """
+        Pick a move for the current board state without any delay.
+        Searches on large boards and MCTS searches return early once
+        should_stop() is True.
+        """
+        board = self._to_bitboard(board)
         
         # Find all empty cells
-        empty_cells = []
-        for row in range(3):
-            for col in range(3):
-                if board[row][col] == '':
-                    empty_cells.append((row, col))
+        empty_cells = board.empty_cells()
         
         if not empty_cells:
             return None
@@ -24,78 +108,65 @@ class AIPlayer:
         if self.difficulty == 'easy':
             return self._make_easy_move(empty_cells)
         elif self.difficulty == 'hard':
-            return self._make_hard_move(board, empty_cells)
+            return self._make_hard_move(board, empty_cells, should_stop)
+        elif self.difficulty == 'mcts':
+            return self._make_mcts_move(board, should_stop)
         else:  # Medium difficulty (default)
-            return self._make_medium_move(board, empty_cells)
+            return self._make_medium_move(board, empty_cells, should_stop)
+    
+    def _to_bitboard(self, board):
+        """Accept either a Bitboard or a list-of-lists board; return a fresh Bitboard."""
+        if isinstance(board, Bitboard):
+            return board.copy()
+        return Bitboard.from_rows(board)
     
     def _make_easy_move(self, empty_cells):
         """Make a random move."""
         return random.choice(empty_cells)
     
-    def _make_medium_move(self, board, empty_cells):
+    def _make_medium_move(self, board, empty_cells, should_stop=None):
         """
         Medium difficulty:
         - 70% chance to make the best move
         - 30% chance to make a random move
         """
         if random.random() < 0.7:
-            return self._make_hard_move(board, empty_cells)
+            return self._make_hard_move(board, empty_cells, should_stop)
         else:
             return self._make_easy_move(empty_cells)
     
-    def _make_hard_move(self, board, empty_cells):
+    def _make_hard_move(self, board, empty_cells, should_stop=None):
         """
         Hard difficulty:
-        - First try to win
-        - Then try to block the player from winning
-        - Then try to take the center
-        - Then try to take a corner
-        - Finally take any available cell
+        - Read the optimal moves from the lookup table
+        - Fall back to solving the position with the negamax engine
+        - Pick randomly between the moves with the best score
+        - On larger boards, search as deep as the time budget allows
         """
-        # Try to win
-        for row, col in empty_cells:
-            board_copy = [row[:] for row in board]
-            board_copy[row][col] = 'O'
-            if self._check_winner(board_copy, 'O'):
-                return row, col
-        
-        # Try to block
-        for row, col in empty_cells:
-            board_copy = [row[:] for row in board]
-            board_copy[row][col] = 'X'
-            if self._check_winner(board_copy, 'X'):
-                return row, col
-        
-        # Take center if available
-        if board[1][1] == '':
-            return 1, 1
-        
-        # Take a corner if available
-        corners = [(0, 0), (0, 2), (2, 0), (2, 2)]
-        available_corners = [corner for corner in corners if board[corner[0]][corner[1]] == '']
-        if available_corners:
-            return random.choice(available_corners)
-        
-        # Take any available cell
-        return random.choice(empty_cells)
+        if board.geometry is not CLASSIC:
+            engine = self.deep_engines.get(board.geometry)
+            if engine is None:
+                engine = self.deep_engines[board.geometry] = IterativeDeepeningEngine(board.geometry)
+            return engine.best_move(board, self.time_budget, should_stop)
+        if self.lookup is not None:
+            # The table has no moves for finished positions or ones where O
+            # moved first; those are solved like any other
+            best_moves = self.lookup.best_moves(board)
+            if best_moves:
+                return random.choice(best_moves)
+        _, best_moves = self.engine.best_moves(board)
+        return random.choice(best_moves)
     
-    def _check_winner(self, board, symbol):
-        """Check if the given symbol has won on this board."""
-        # Check rows
-        for row in board:
-            if row[0] == row[1] == row[2] == symbol:
-                return True
-        
-        # Check columns
-        for col in range(3):
-            if board[0][col] == board[1][col] == board[2][col] == symbol:
-                return True
-        
-        # Check diagonals
-        if board[0][0] == board[1][1] == board[2][2] == symbol:
-            return True
-        
-        if board[0][2] == board[1][1] == board[2][0] == symbol:
-            return True
-        
-        return False
\ No newline at end of file
+    def _make_mcts_move(self, board, should_stop=None):
+        """
+        MCTS strategy:
+        - Run random playouts in parallel worker processes
+        - Play the move with the most visits; strength scales with the budget
+        """
+        if AIPlayer.mcts_engine is None:
+            AIPlayer.mcts_engine = MCTSEngine()
+        if self.mcts_playouts is not None:
+            return self.mcts_engine.best_move(board, playouts=self.mcts_playouts,
+                                              seed=random.getrandbits(32), should_stop=should_stop)
+        return self.mcts_engine.best_move(board, time_budget=self.time_budget,
+                                          seed=random.getrandbits(32), should_stop=should_stop)
@@ -1,8 +1,15 @@
 import pygame
-import math
 import random
+from bitboard import CLASSIC
+from particle_system import ParticlePool, ParticleSystem
+from sprite_cache import shared_cache
 
 class AnimationEffects:
+    """
+    Win line, hover pulse and celebration particles. update_animations()
+    advances one fixed simulation tick; the draw methods take alpha, how
+    far the frame falls between the last two ticks, and interpolate.
+    """
     def __init__(self):
         # Colors
         self.highlight_color = (245, 245, 245, 150)  # Semi-transparent white
@@ -15,6 +22,9 @@ class AnimationEffects:
         self.win_line_progress = 0
         self.pulse_factor = 0
         self.pulse_direction = 1
+        # Values before the last tick, for interpolation
+        self.previous_win_line_progress = 0
+        self.previous_pulse_factor = 0
         
         # Animation states
         self.animate_win_line = False
@@ -23,7 +33,6 @@ class AnimationEffects:
         self.win_animation_done = False
         
         # Particle effects
-        self.particles = []
         self.particle_colors = [
             (80, 140, 250),    # Blue
             (241, 90, 90),     # Red
@@ -33,39 +42,52 @@ class AnimationEffects:
             (255, 150, 0),     # Orange
             (0, 255, 255),     # Cyan
         ]
-        
-        # New particle properties
-        self.particle_trails = []
-        self.glow_particles = []
+        self.celebration_particle_count = 100
+        self.particles = ParticleSystem(self.particle_colors)
+        self.glow_particles = ParticlePool(4096)
+        self.sprites = shared_cache()
+        
+        # Screen regions that changed in the last draw_animations() (see RenderPipeline)
+        self.dirty_rects = []
+        # Surfaces created while drawing, in total (see FrameProfiler.count)
+        self.surfaces_allocated = 0
+        self.drawn_line_progress = None
     
-    def start_win_animation(self, win_type, cell_size, board_x, board_y):
-        """Start the winning line animation."""
+    def start_win_animation(self, win_type, cell_size, board_x, board_y, endpoints=None):
+        """
+        Start the winning line animation.
+        endpoints is the ((row, col), (row, col)) of the first and last cell
+        of the line (see GameBoard.get_win_endpoints); it is looked up from
+        win_type on a 3x3 board when not given.
+        """
         self.animate_win_line = True
         self.win_line_progress = 0
+        self.previous_win_line_progress = 0
         
-        half_cell = cell_size / 2
-        
-        # Set start and end points based on win type
-        if win_type.startswith('row'):
-            row = int(win_type[3])
-            self.win_line_start = (board_x, board_y + row * cell_size + half_cell)
-            self.win_line_end = (board_x + 3 * cell_size, board_y + row * cell_size + half_cell)
+        if endpoints is None:
+            endpoints = CLASSIC.endpoints[win_type]
+        (start_row, start_col), (end_row, end_col) = endpoints
         
-        elif win_type.startswith('col'):
-            col = int(win_type[3])
-            self.win_line_start = (board_x + col * cell_size + half_cell, board_y)
-            self.win_line_end = (board_x + col * cell_size + half_cell, board_y + 3 * cell_size)
-        
-        elif win_type == 'diag1':  # Top-left to bottom-right
-            self.win_line_start = (board_x, board_y)
-            self.win_line_end = (board_x + 3 * cell_size, board_y + 3 * cell_size)
+        # Unit step along the line, so it can be extended half a cell past
+        # the centers of its end cells (edge to edge, corner to corner)
+        step_x = (end_col > start_col) - (end_col < start_col)
+        step_y = (end_row > start_row) - (end_row < start_row)
+        half_cell = cell_size / 2
         
-        elif win_type == 'diag2':  # Top-right to bottom-left
-            self.win_line_start = (board_x + 3 * cell_size, board_y)
-            self.win_line_end = (board_x, board_y + 3 * cell_size)
+        self.win_line_start = (
+            board_x + start_col * cell_size + half_cell - step_x * half_cell,
+            board_y + start_row * cell_size + half_cell - step_y * half_cell
+        )
+        self.win_line_end = (
+            board_x + end_col * cell_size + half_cell + step_x * half_cell,
+            board_y + end_row * cell_size + half_cell + step_y * half_cell
+        )
     
     def update_animations(self):
-        """Update all animation states."""
+        """Advance all animation states by one tick."""
+        self.previous_win_line_progress = self.win_line_progress
+        self.previous_pulse_factor = self.pulse_factor
+        
         # Update win line animation
         if self.animate_win_line and self.win_line_progress < 1:
             self.win_line_progress += 0.03
@@ -86,12 +108,17 @@ class AnimationEffects:
         # Update particles
         self._update_particles()
     
-    def draw_animations(self, surface):
-        """Draw all active animations."""
+    def draw_animations(self, surface, alpha=1.0):
+        """Draw all active animations, alpha of the way through the last tick."""
+        self.dirty_rects = []
+        cache_misses = self.sprites.misses
+        
         # Draw win line if animating
         if self.animate_win_line:
-            current_end_x = self.win_line_start[0] + (self.win_line_end[0] - self.win_line_start[0]) * self.win_line_progress
-            current_end_y = self.win_line_start[1] + (self.win_line_end[1] - self.win_line_start[1]) * self.win_line_progress
+            progress = self.previous_win_line_progress + (
+                self.win_line_progress - self.previous_win_line_progress) * alpha
+            current_end_x = self.win_line_start[0] + (self.win_line_end[0] - self.win_line_start[0]) * progress
+            current_end_y = self.win_line_start[1] + (self.win_line_end[1] - self.win_line_start[1]) * progress
             
             pygame.draw.line(
                 surface, 
@@ -100,20 +127,46 @@ class AnimationEffects:
                 (current_end_x, current_end_y), 
                 self.win_line_width
             )
+            
+            # Only a growing line changes the screen
+            if progress != self.drawn_line_progress:
+                self.drawn_line_progress = progress
+                line_rect = pygame.Rect(
+                    min(self.win_line_start[0], current_end_x),
+                    min(self.win_line_start[1], current_end_y),
+                    abs(current_end_x - self.win_line_start[0]) + 1,
+                    abs(current_end_y - self.win_line_start[1]) + 1
+                )
+                self.dirty_rects.append(line_rect.inflate(self.win_line_width * 2, self.win_line_width * 2))
         
         # Draw particles
-        self._draw_particles(surface)
+        self._draw_particles(surface, alpha)
+        
+        # Particles and their trails spread out, so mark them as one area
+        particle_rects = [
+            pygame.Rect(glow.x - glow.size, glow.y - glow.size, glow.size * 2, glow.size * 2)
+            for glow in self.glow_particles
+        ]
+        particle_bounds = self.particles.bounding_rect()
+        if particle_bounds is not None:
+            particle_rects.append(particle_bounds)
+        if particle_rects:
+            self.dirty_rects.append(particle_rects[0].unionall(particle_rects[1:]).inflate(4, 4))
+        
+        # Every sprite cache miss rendered a new surface
+        self.surfaces_allocated += self.sprites.misses - cache_misses
     
-    def draw_hover_effect(self, surface, cell_x, cell_y, cell_size):
+    def draw_hover_effect(self, surface, cell_x, cell_y, cell_size, alpha=1.0):
         """Draw hover effect with pulsing animation."""
         # Calculate pulse size (slightly larger or smaller based on pulse factor)
-        pulse_size = int(cell_size * (1 + self.pulse_factor * 0.05))
+        pulse_factor = self.previous_pulse_factor + (self.pulse_factor - self.previous_pulse_factor) * alpha
+        pulse_size = int(cell_size * (1 + pulse_factor * 0.05))
         offset = (pulse_size - cell_size) // 2
         
-        # Create semi-transparent surface for the hover effect
-        hover_surface = pygame.Surface((pulse_size, pulse_size), pygame.SRCALPHA)
-        pygame.draw.rect(hover_surface, self.highlight_color, 
-                        (0, 0, pulse_size, pulse_size), 0)
+        # Semi-transparent square for the hover effect
+        cache_misses = self.sprites.misses
+        hover_surface = self.sprites.rect(pulse_size, pulse_size, self.highlight_color)
+        self.surfaces_allocated += self.sprites.misses - cache_misses
         
         # Draw the pulsing hover effect
         surface.blit(hover_surface, (cell_x - offset, cell_y - offset))
@@ -122,124 +175,47 @@ class AnimationEffects:
         """Reset all animation states."""
         self.animate_win_line = False
         self.win_line_progress = 0
+        self.previous_win_line_progress = 0
         self.win_animation_done = False
-        self.particles = []
+        self.drawn_line_progress = None
+        self.particles.clear()
     
     def _create_celebration_particles(self):
         """Create enhanced particles for win celebration."""
         center_x = (self.win_line_start[0] + self.win_line_end[0]) / 2
         center_y = (self.win_line_start[1] + self.win_line_end[1]) / 2
         
-        # Create more particles with varied effects
-        for _ in range(100):  # Increased from 50 to 100
-            angle = math.radians(random.uniform(0, 360))
-            speed = random.uniform(2, 8)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            color = random.choice(self.particle_colors)
-            size = random.randint(4, 12)
-            lifetime = random.randint(40, 120)
-            
-            particle = {
-                'x': center_x,
-                'y': center_y,
-                'vel_x': vel_x,
-                'vel_y': vel_y,
-                'size': size,
-                'color': color,
-                'lifetime': lifetime,
-                'trail': [],  # Add trail effect
-                'angular_vel': random.uniform(-5, 5),  # Add rotation
-                'type': random.choice(['circle', 'star', 'spark'])
-            }
-            
-            self.particles.append(particle)
-            
-            # Add some glowing particles
+        new = self.particles.emit_burst(center_x, center_y, self.celebration_particle_count)
+        
+        # Add some glowing particles (fading over a quarter of the
+        # particle's lifetime)
+        for color, lifetime in zip(self.particles.color[new].tolist(), self.particles.lifetime[new].tolist()):
             if random.random() < 0.3:
-                self.glow_particles.append({
-                    'x': center_x,
-                    'y': center_y,
-                    'size': random.randint(20, 40),
-                    'color': color,
-                    'lifetime': lifetime // 2,
-                    'alpha': 255
-                })
+                glow = self.glow_particles.acquire()
+                if glow is None:
+                    break
+                glow.x = center_x
+                glow.y = center_y
+                glow.size = random.randint(20, 40)
+                glow.color = (*self.particle_colors[color], 255)
+                glow.lifetime = lifetime // 4
     
     def _update_particles(self):
-        """Update particle positions and lifetimes."""
-        for particle in self.particles[:]:
-            # Update position
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            
-            # Apply gravity
-            particle['vel_y'] += 0.1
-            
-            # Decrease lifetime
-            particle['lifetime'] -= 1
-            
-            # Update trail
-            particle['trail'].append({
-                'x': particle['x'],
-                'y': particle['y'],
-                'size': max(1, particle['size'] // 2),
-                'alpha': max(0, int(255 * (particle['lifetime'] / 120)))
-            })
-            if len(particle['trail']) > 10:
-                particle['trail'].pop(0)
-            
-            # Remove dead particles
-            if particle['lifetime'] <= 0:
-                self.particles.remove(particle)
-        
-        for glow in self.glow_particles[:]:
-            glow['lifetime'] -= 1
-            if glow['lifetime'] <= 0:
-                self.glow_particles.remove(glow)
+        """Update particle positions and lifetimes by one tick."""
+        self.particles.update()
+        
+        for glow in self.glow_particles:
+            glow.lifetime -= 1
+            if glow.lifetime <= 0:
+                self.glow_particles.release(glow)
     
-    def _draw_particles(self, surface):
+    def _draw_particles(self, surface, alpha):
         """Draw enhanced particles with effects."""
-        # Draw glow particles first
-        for glow in self.glow_particles[:]:
-            glow_surface = pygame.Surface((glow['size'] * 2, glow['size'] * 2), pygame.SRCALPHA)
-            color = list(glow['color']) + [glow['alpha']]
-            pygame.draw.circle(glow_surface, color, (glow['size'], glow['size']), glow['size'])
-            surface.blit(glow_surface, (glow['x'] - glow['size'], glow['y'] - glow['size']), special_flags=pygame.BLEND_ADD)
-            glow['alpha'] = max(0, glow['alpha'] - 5)
-            glow['lifetime'] -= 1
-            if glow['lifetime'] <= 0:
-                self.glow_particles.remove(glow)
+        # Draw glow particles first (BLEND_ADD ignores per-pixel alpha, so
+        # one opaque sprite per size and color covers the whole fade)
+        for glow in self.glow_particles:
+            glow_surface = self.sprites.circle(glow.size, glow.color)
+            surface.blit(glow_surface, (glow.x - glow.size, glow.y - glow.size), special_flags=pygame.BLEND_ADD)
         
         # Draw regular particles with their trails
-        for particle in self.particles:
-            # Draw trail
-            for trail_pos in particle['trail']:
-                size = trail_pos['size']
-                alpha = trail_pos['alpha']
-                color = list(particle['color']) + [alpha]
-                
-                trail_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(trail_surface, color, (size, size), size)
-                surface.blit(trail_surface, (trail_pos['x'] - size, trail_pos['y'] - size))
-            
-            # Draw main particle
-            if particle['type'] == 'circle':
-                pygame.draw.circle(surface, particle['color'], 
-                                (int(particle['x']), int(particle['y'])), 
-                                particle['size'])
-            elif particle['type'] == 'star':
-                self._draw_star(surface, particle)
-            else:  # spark
-                self._draw_spark(surface, particle)
-    
-    def _draw_star(self, surface, particle):
-        """Draw a star-shaped particle."""
-        # Placeholder for star drawing logic
-        pass
-    
-    def _draw_spark(self, surface, particle):
-        """Draw a spark-shaped particle."""
-        # Placeholder for spark drawing logic
-        pass
\ No newline at end of file
+        self.particles.draw(surface, alpha)
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Vectorized evaluation of many 3x3 positions at once.
+
+Boards are rows of an (N, 9) int8 array with cell i = row * 3 + col set
+to 0 (empty), 1 (X) or 2 (O), the same digits the lookup table indexes
+by. Win flags come from one matrix product against the 8 line masks and
+best moves and outcomes from one gather into the memory-mapped lookup
+table, so there is no Python loop per board.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+import lookup_table
+from bitboard import BOARD_CELLS, FULL_MASK, SET_CELLS, WIN_MASKS
+from negamax import MOVE_PREFERENCE
+
+EMPTY = 0
+X = 1
+O = 2
+
+# (9, 8) matrix: column j has a 1 for every cell on winning line j
+LINE_MATRIX = np.array(
+    [[mask >> cell & 1 for mask in WIN_MASKS] for cell in range(BOARD_CELLS)],
+    dtype=np.int8
+)
+
+# Base-3 place value of each cell, matching lookup_table.position_index
+PLACE_VALUES = 3 ** np.arange(BOARD_CELLS, dtype=np.int32)
+
+# For every optimal-move mask, the single move to report (-1 if none),
+# using the same center, corner, edge preference as the search
+PREFERRED_MOVE = np.array(
+    [next((cell for cell in MOVE_PREFERENCE if cell in SET_CELLS[mask]), -1)
+     for mask in range(FULL_MASK + 1)],
+    dtype=np.int8
+)
+
+BatchResult = namedtuple('BatchResult', ['best_moves', 'move_masks', 'outcomes', 'x_wins', 'o_wins'])
+
+
+def win_flags(boards):
+    """Return (x_wins, o_wins) boolean arrays for an (N, 9) board array."""
+    boards = np.asarray(boards, dtype=np.int8)
+    x_lines = (boards == X).view(np.int8) @ LINE_MATRIX
+    o_lines = (boards == O).view(np.int8) @ LINE_MATRIX
+    return (x_lines == 3).any(axis=1), (o_lines == 3).any(axis=1)
+
+
+def evaluate_batch(boards, table=None):
+    """
+    Evaluate an (N, 9) int8 array of boards. Returns a BatchResult of arrays:
+        - best_moves: preferred optimal cell index (row * 3 + col), -1 if none
+        - move_masks: bit mask of every optimal cell
+        - outcomes:   lookup_table.OUTCOME_* for the player to move
+                      (OUTCOME_UNREACHABLE for positions legal play can't reach)
+        - x_wins, o_wins: whether each player has a completed line
+    """
+    # Check the values before casting, so wider integers can't wrap into range
+    boards = np.asarray(boards)
+    if boards.ndim != 2 or boards.shape[1] != BOARD_CELLS:
+        raise ValueError(f"boards must have shape (N, {BOARD_CELLS}), got {boards.shape}")
+    if boards.size and (not np.issubdtype(boards.dtype, np.integer) or
+                        boards.min() < EMPTY or boards.max() > O):
+        raise ValueError(f"board cells must be {EMPTY} (empty), {X} (X) or {O} (O), "
+                         f"got {boards.dtype} values from {boards.min()} to {boards.max()}")
+    boards = boards.astype(np.int8, copy=False)
+    if table is None:
+        table = _default_table()
+
+    entries = table.as_array()[boards @ PLACE_VALUES]
+    move_masks = entries & lookup_table.MOVES_MASK
+    x_wins, o_wins = win_flags(boards)
+    return BatchResult(
+        best_moves=PREFERRED_MOVE[move_masks],
+        move_masks=move_masks,
+        outcomes=(entries >> lookup_table.OUTCOME_SHIFT).astype(np.int8),
+        x_wins=x_wins,
+        o_wins=o_wins,
+    )
+
+
+_table = None
+
+
+def _default_table():
+    """Map the default lookup table once, building it if needed."""
+    global _table
+    if _table is None:
+        _table = lookup_table.load()
+        if _table is None:
+            raise OSError(f"couldn't load or build {lookup_table.DEFAULT_PATH}")
+    return _table
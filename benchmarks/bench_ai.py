@@ -0,0 +1,352 @@
+"""
+AI regression benchmarks: move latency and memory for every AIPlayer
+strategy, plus raw engine throughput, checked against a stored baseline.
+
+Moves are timed with choose_move(), which skips make_move()'s thinking
+delay, from every non-terminal reachable 3x3 position (MCTS, which is
+much slower per move, from every 20th). Peak Python heap per strategy is
+measured in a separate tracemalloc pass so tracing doesn't skew the
+timings.
+
+Before timing anything, every strategy must return a legal move from
+positions outside normal play (O moved first, a line already complete);
+if one doesn't, the run fails.
+
+Results are written as JSON. Each metric records whether lower or higher
+is better; gated metrics that are worse than the baseline by more than
+--threshold (a fraction, default 0.25) fail the run with exit status 1.
+Every timing covers at least MIN_SAMPLE_S of work (passing over the
+positions, or repeating a solve, as often as it takes), is taken
+--repeat times and the best kept, which filters out most scheduler
+noise. A machine's speed can still drift by half or more from one
+minute to the next (frequency scaling, shared hosts), so timings are
+gated relative to a fixed pure-Python reference loop timed around each
+sample ('ref' units: a move time as a multiple of the loop's time, a
+rate as work done per loop time); the raw microseconds and rates are
+reported alongside. Heap peaks under HEAP_GATE_KIB are reported but not
+gated: a few hundred bytes either way is noise, not a regression.
+Baselines are still machine-specific: regenerate with --update-baseline
+on the machine that runs the check.
+
+Run from the repository root:
+    python -m benchmarks.bench_ai [--threshold 0.25] [--repeat 5] [--output PATH]
+                                  [--baseline PATH] [--update-baseline]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from ai_player import AIPlayer
+from bitboard import Bitboard, FULL_MASK, WIN_LINE, get_geometry, is_win
+from iterative_search import IterativeDeepeningEngine
+from lookup_table import reachable_positions
+from mcts import MCTSEngine
+from negamax import NegamaxEngine
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_ai_baseline.json')
+DEFAULT_OUTPUT = 'bench_ai_results.json'
+
+MCTS_STRIDE = 20
+MCTS_PLAYOUTS = 200
+MEMORY_STRIDE = 10
+MIN_SAMPLE_S = 0.25
+HEAP_GATE_KIB = 16
+REFERENCE_LOOPS = 200000
+
+
+def open_positions():
+    """Every reachable 3x3 position where a move is still to be made, in a fixed order."""
+    return [Bitboard(x, o) for x, o in sorted(reachable_positions())
+            if WIN_LINE[x] < 0 and WIN_LINE[o] < 0 and (x | o) != FULL_MASK]
+
+
+def make_players():
+    """Return {name: AIPlayer} for every strategy, with no thinking delay."""
+    # The search fallback gets its own player with no table and a cold engine
+    hard_search = AIPlayer('hard', think_time=0)
+    hard_search.lookup = None
+    hard_search.engine = NegamaxEngine()
+    return {
+        'easy': AIPlayer('easy', think_time=0),
+        'medium': AIPlayer('medium', think_time=0),
+        'hard': AIPlayer('hard', think_time=0),
+        'hard_search': hard_search,
+        'mcts': AIPlayer('mcts', think_time=0, mcts_playouts=MCTS_PLAYOUTS),
+    }
+
+
+# Positions the lookup table has no moves for, as list-of-lists boards
+EDGE_POSITIONS = [
+    [['O', '', ''], ['', '', ''], ['', '', '']],      # O moved first
+    [['X', 'X', 'X'], ['O', 'O', ''], ['', '', '']],  # X already won
+]
+
+
+def check_edge_positions():
+    """Return a message for every strategy and edge position without a legal move."""
+    failures = []
+    for name, player in make_players().items():
+        for rows in EDGE_POSITIONS:
+            try:
+                move = player.choose_move(rows)
+            except Exception as error:
+                failures.append(f"{name} raised {error!r} for {rows}")
+                continue
+            if move is None or rows[move[0]][move[1]] != '':
+                failures.append(f"{name} returned {move!r} for {rows}")
+    return failures
+
+
+def reference_seconds():
+    """Time a fixed pure-Python loop, the yardstick timings are gated against."""
+    start = time.perf_counter()
+    total = 0
+    for i in range(REFERENCE_LOOPS):
+        total += i & 7
+    return time.perf_counter() - start
+
+
+def time_moves(name, positions):
+    """
+    Time choose_move() for a strategy over positions, passing over them
+    again with a fresh player (so the search fallback's table starts cold
+    each time) until MIN_SAMPLE_S of moves have been timed. Returns each
+    position's fastest time in microseconds, and in reference loop times.
+    """
+    fastest = np.full(len(positions), np.inf)
+    relative = np.full(len(positions), np.inf)
+    total = 0.0
+    while total < MIN_SAMPLE_S:
+        random.seed(0)
+        player = make_players()[name]
+        times = np.empty(len(positions))
+        before = reference_seconds()
+        for i, board in enumerate(positions):
+            start = time.perf_counter()
+            player.choose_move(board)
+            times[i] = time.perf_counter() - start
+        reference = (before + reference_seconds()) / 2
+        total += times.sum()
+        np.minimum(fastest, times, out=fastest)
+        np.minimum(relative, times / reference, out=relative)
+    return fastest * 1e6, relative
+
+
+def heap_peak(player, positions):
+    """Return the peak traced Python heap in KiB while moving from positions."""
+    # Collect first and hold off collection, so the peak doesn't depend on
+    # when the cycle collector happens to run
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        for board in positions:
+            player.choose_move(board)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+
+def metric(value, unit, better=None):
+    """A result; better is 'lower' or 'higher' for gated metrics, None for information only."""
+    return {'value': float(value), 'unit': unit, 'better': better}
+
+
+def best_rate(repeat, measure):
+    """
+    Call measure() -> (work done, seconds) repeat times, timing the
+    reference loop around each call. Returns the best work per second and
+    the best work per reference loop time.
+    """
+    rate = relative = 0.0
+    for _ in range(repeat):
+        before = reference_seconds()
+        work, seconds = measure()
+        reference = (before + reference_seconds()) / 2
+        rate = max(rate, work / seconds)
+        relative = max(relative, work / seconds * reference)
+    return rate, relative
+
+
+def add_rate(results, name, unit, rates):
+    """Add the raw and gated relative metrics for best_rate()'s result."""
+    rate, relative = rates
+    results[f'{name}_per_s'] = metric(rate, f'{unit}/s')
+    results[f'{name}_per_ref'] = metric(relative, f'{unit}/ref', 'higher')
+
+
+def repeat_for_sample(measure):
+    """Call measure() -> (work done, seconds) until MIN_SAMPLE_S has passed; return the totals."""
+    work = seconds = 0
+    while seconds < MIN_SAMPLE_S:
+        done, elapsed = measure()
+        work += done
+        seconds += elapsed
+    return work, seconds
+
+
+def solve_empty_board():
+    # A fresh engine each time so the transposition table starts cold
+    engine = NegamaxEngine()
+    start = time.perf_counter()
+    engine.solve(Bitboard())
+    return engine.nodes, time.perf_counter() - start
+
+
+def search_15x15():
+    board = Bitboard(geometry=get_geometry(15, 5))
+    board.place(7, 7, 'X')
+    engine = IterativeDeepeningEngine(board.geometry)
+    start = time.perf_counter()
+    engine.best_move(board, time_budget=0.5)
+    return engine.nodes, time.perf_counter() - start
+
+
+def run_playouts(size, win_length):
+    board = Bitboard(geometry=get_geometry(size, win_length))
+    start = time.perf_counter()
+    AIPlayer.mcts_engine.best_move(board, playouts=2000, seed=0)
+    return AIPlayer.mcts_engine.playouts, time.perf_counter() - start
+
+
+def check_wins(bits):
+    start = time.perf_counter()
+    for b in bits:
+        is_win(b)
+    return len(bits), time.perf_counter() - start
+
+
+def run(repeat=5):
+    """Run every benchmark, keeping the best of repeat runs. Returns {metric name: metric}."""
+    # MCTS runs inline so the numbers don't depend on the core count
+    AIPlayer.mcts_engine = MCTSEngine(workers=1)
+    positions = open_positions()
+    results = {}
+
+    # Each position keeps its fastest time over every pass of every round
+    times = {}
+    relative = {}
+    for _ in range(repeat):
+        for name in make_players():
+            sample = positions[::MCTS_STRIDE] if name == 'mcts' else positions
+            fastest, fastest_relative = time_moves(name, sample)
+            times[name] = np.minimum(times.get(name, fastest), fastest)
+            relative[name] = np.minimum(relative.get(name, fastest_relative), fastest_relative)
+
+    random.seed(0)
+    for name, player in make_players().items():
+        sample = positions[::MCTS_STRIDE] if name == 'mcts' else positions
+        results[f'move.{name}.mean_ref'] = metric(relative[name].mean(), 'ref', 'lower')
+        results[f'move.{name}.mean_us'] = metric(times[name].mean(), 'us')
+        results[f'move.{name}.p50_us'] = metric(np.percentile(times[name], 50), 'us')
+        results[f'move.{name}.p95_us'] = metric(np.percentile(times[name], 95), 'us')
+        results[f'move.{name}.max_us'] = metric(times[name].max(), 'us')
+        results[f'move.{name}.positions'] = metric(len(sample), 'positions')
+        results[f'move.{name}.heap_peak_kb'] = metric(
+            heap_peak(player, sample[::MEMORY_STRIDE]), 'KiB', 'lower')
+
+    # Negamax solving the empty board from a cold transposition table
+    add_rate(results, 'negamax.nodes', 'nodes',
+             best_rate(repeat, lambda: repeat_for_sample(solve_empty_board)))
+    # Iterative deepening on a 15x15 board for a fixed time
+    add_rate(results, 'iterative.nodes', 'nodes', best_rate(repeat, search_15x15))
+    # MCTS playouts, single process
+    for size, win_length in ((3, 3), (15, 5)):
+        add_rate(results, f'mcts.{size}x{size}.playouts', 'playouts',
+                 best_rate(repeat, lambda: repeat_for_sample(lambda: run_playouts(size, win_length))))
+    # Win checks over every reachable position's X and O bits
+    bits = [b for x, o in reachable_positions() for b in (x, o)]
+    add_rate(results, 'is_win.calls', 'calls',
+             best_rate(repeat, lambda: repeat_for_sample(lambda: check_wins(bits))))
+
+    AIPlayer.mcts_engine.close()
+    AIPlayer.mcts_engine = None
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return [(name, slowdown)] for gated metrics worse than baseline by more than threshold."""
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        better = current['better']
+        if reference is None or better is None or not reference['value'] or not current['value']:
+            continue
+        if current['unit'] == 'KiB' and reference['value'] < HEAP_GATE_KIB:
+            continue
+        if better == 'lower':
+            slowdown = current['value'] / reference['value'] - 1
+        else:
+            slowdown = reference['value'] / current['value'] - 1
+        if slowdown > threshold:
+            regressions.append((name, slowdown))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the AI strategies against a baseline.")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="where to write the results")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed slowdown as a fraction (0.25 = 25%%)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="runs of each measurement; the best is kept")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="store these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    AIPlayer.mcts_engine = MCTSEngine(workers=1)
+    failures = check_edge_positions()
+    for failure in failures:
+        print(f"FAILED {failure}")
+    if failures:
+        return 1
+
+    results = run(args.repeat)
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'metrics': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['metrics']
+    except OSError:
+        baseline = {}
+
+    for name, current in results.items():
+        reference = baseline.get(name)
+        change = ''
+        if reference and reference['value']:
+            change = f"{current['value'] / reference['value'] - 1:+8.1%}"
+        print(f"{name:<32} {current['value']:>14.4g} {current['unit']:<11} {change}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for name, slowdown in regressions:
+        print(f"REGRESSION {name}: {slowdown:.1%} worse than baseline (threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
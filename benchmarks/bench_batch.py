@@ -0,0 +1,38 @@
+"""
+Measure batch evaluation throughput on random reachable positions.
+
+Run from the repository root:
+    python -m benchmarks.bench_batch [number of boards]
+"""
+import sys
+import time
+
+import numpy as np
+
+import batch_eval
+import lookup_table
+from bitboard import BOARD_CELLS
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    positions = sorted(lookup_table.reachable_positions())
+    unique = np.zeros((len(positions), BOARD_CELLS), dtype=np.int8)
+    for i, (x, o) in enumerate(positions):
+        for cell in range(BOARD_CELLS):
+            unique[i, cell] = batch_eval.X if x >> cell & 1 else batch_eval.O if o >> cell & 1 else 0
+    rng = np.random.default_rng(0)
+    boards = unique[rng.integers(0, len(unique), count)]
+
+    batch_eval.evaluate_batch(boards[:1000])  # Map the table before timing
+    start = time.perf_counter()
+    result = batch_eval.evaluate_batch(boards)
+    elapsed = time.perf_counter() - start
+
+    print(f"{count} boards in {elapsed * 1000:.1f} ms: {count / elapsed / 1e6:.2f} M positions/s")
+    print(f"X wins {result.x_wins.mean():.1%}, O wins {result.o_wins.mean():.1%}, "
+          f"{(result.best_moves >= 0).mean():.1%} with a move to play")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Measure the cost of building, mapping and querying the move lookup table.
+
+Run from the repository root:
+    python -m benchmarks.bench_lookup
+"""
+import os
+import random
+import resource
+import tempfile
+import time
+import tracemalloc
+
+import lookup_table
+from bitboard import Bitboard, FULL_MASK, WIN_LINE
+
+
+def rss_kb():
+    """Current resident set size in KiB, or the peak where /proc is unavailable."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), 'tictactoe.lut')
+
+    start = time.perf_counter()
+    lookup_table.build(path)
+    build_time = time.perf_counter() - start
+
+    rss_before = rss_kb()
+    tracemalloc.start()
+    start = time.perf_counter()
+    table = lookup_table.LookupTable(path)
+    open_time = time.perf_counter() - start
+    _, heap_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    boards = [Bitboard(x, o) for x, o in lookup_table.reachable_positions()
+              if WIN_LINE[x] < 0 and WIN_LINE[o] < 0 and x | o != FULL_MASK]
+    # Touch every entry so the whole mapping is paged in
+    for board in boards:
+        table.outcome(board)
+    rss_growth = rss_kb() - rss_before
+
+    queries = [random.choice(boards) for _ in range(200000)]
+    start = time.perf_counter()
+    for board in queries:
+        table.best_moves(board)
+    lookup_time = time.perf_counter() - start
+
+    print(f"File:     {os.path.getsize(path)} bytes, format version {lookup_table.VERSION}")
+    print(f"Build:    {build_time * 1000:.1f} ms for {len(boards)} non-terminal positions")
+    print(f"Open:     {open_time * 1e6:.1f} us, {heap_peak} bytes of Python heap")
+    print(f"Resident: {rss_growth} KiB RSS growth with every entry paged in")
+    print(f"Lookup:   {lookup_time / len(queries) * 1e9:.0f} ns per move")
+    table.close()
+
+
+if __name__ == "__main__":
+    main()
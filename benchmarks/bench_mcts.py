@@ -0,0 +1,40 @@
+"""
+Measure how MCTS playout throughput scales with worker processes.
+
+Run from the repository root:
+    python -m benchmarks.bench_mcts [seconds per run]
+"""
+import os
+import sys
+import time
+
+from bitboard import Bitboard, get_geometry
+from mcts import MCTSEngine
+
+
+def main():
+    time_budget = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+
+    for size, win_length in ((3, 3), (15, 5)):
+        board = Bitboard(geometry=get_geometry(size, win_length))
+        board.place(size // 2, size // 2, 'X')
+        print(f"{size}x{size}, {win_length} in a row, {time_budget:.1f} s per move")
+        baseline = None
+        for workers in worker_counts:
+            engine = MCTSEngine(workers=workers)
+            # Warm the pool up so process start-up isn't measured
+            engine.best_move(board, playouts=workers)
+            start = time.perf_counter()
+            move = engine.best_move(board, time_budget=time_budget, seed=0)
+            elapsed = time.perf_counter() - start
+            engine.close()
+            rate = engine.playouts / elapsed
+            baseline = baseline or rate
+            print(f"  {workers:>2} workers: {rate:10.0f} playouts/s  "
+                  f"({rate / baseline:4.2f}x)  best move {move}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Measure the per-frame cost of updating and drawing celebration particles
+with their trails, holding the particle count steady.
+
+Every frame, bursts top the system back up to the target count, so the
+numbers cover a steady state of particles at every age (and trail
+length), as in a long celebration.
+
+Run from the repository root (no window is opened):
+    python -m benchmarks.bench_particles [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from animation_effects import AnimationEffects
+from particle_system import ParticleSystem
+
+WIDTH, HEIGHT = 700, 800
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    palette = AnimationEffects().particle_colors
+
+    for count in (100, 1000, 10000, 20000):
+        particles = ParticleSystem(palette, capacity=count, seed=0)
+        # Warm up until particles of every age are present
+        for _ in range(150):
+            particles.emit_burst(WIDTH / 2, HEIGHT / 2, count - particles.count)
+            particles.update()
+
+        update_time = draw_time = 0.0
+        for _ in range(frames):
+            screen.fill((25, 25, 35))
+            start = time.perf_counter()
+            particles.emit_burst(WIDTH / 2, HEIGHT / 2, count - particles.count)
+            particles.update()
+            middle = time.perf_counter()
+            particles.draw(screen, 0.5)
+            end = time.perf_counter()
+            update_time += middle - start
+            draw_time += end - middle
+        total = (update_time + draw_time) / frames * 1000
+        print(f"{count:>6} particles: update {update_time / frames * 1000:.3f} ms, "
+              f"draw {draw_time / frames * 1000:.3f} ms, "
+              f"{total:.3f} ms/frame ({total / (1000 / 60):.1%} of a 60 FPS frame)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
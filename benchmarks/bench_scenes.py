@@ -0,0 +1,158 @@
+"""
+Play a scripted session of the real game loop headlessly and report frame
+times, surface allocations and memory for each scene.
+
+main.main() runs under SDL's dummy video driver while a frame hook posts
+the input: the menu with a hovered button, the fade into a game, hovering
+an empty cell, the AI's turns, a win celebration and the fade back to the
+menu. The script plays corners and edges against the hard AI, which wins
+the same way every time, so runs are comparable. Effect quality is pinned
+at full, so the adaptive governor can't trade effects for frame time
+partway through a run and make the timings incomparable.
+
+The session is played twice: once for timings and resident memory, and
+once under tracemalloc for the Python heap peak, which would otherwise
+distort the timings.
+
+Run from the repository root:
+    python -m benchmarks.bench_scenes [--no-memory] [--json PATH]
+"""
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+
+import main as game
+from benchmarks.bench_lookup import rss_kb
+from quality_governor import QualityGovernor
+
+# Screen positions in main.main()'s 700x800 layout
+HARD_BUTTON = (550, 630)
+START_BUTTON = (350, 710)
+MENU_BUTTON = (450, 730)
+EASY_BUTTON = (150, 630)
+
+
+def cell(row, col):
+    """Center of a board cell (3x3 board at (100, 150), 166 px cells)."""
+    return (183 + 166 * col, 233 + 166 * row)
+
+
+def move(pos):
+    return [pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))]
+
+
+def click(pos):
+    return move(pos) + [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1),
+                        pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1)]
+
+
+# (scene, frames, events posted as the scene starts)
+SCRIPT = [
+    ('fade', 60, []),
+    ('menu', 180, move(EASY_BUTTON)),
+    ('fade', 110, click(HARD_BUTTON) + click(START_BUTTON)),
+    ('hover', 120, move(cell(1, 1))),
+    ('ai_turn', 60, click(cell(0, 0))),
+    ('hover', 60, move(cell(1, 2))),
+    ('ai_turn', 60, click(cell(0, 1))),
+    ('ai_turn', 60, click(cell(1, 0))),  # The AI completes the 2-4-6 diagonal
+    ('celebration', 240, []),
+    ('fade', 110, click(MENU_BUTTON)),
+]
+
+
+def play(trace_memory=False):
+    """Run the script once. Returns {scene: stats}."""
+    steps = iter(SCRIPT)
+    current = {'scene': None, 'left': 0}
+    samples = {}
+    peaks = {}
+
+    def start_next_step():
+        step = next(steps, None)
+        if step is None:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+            return
+        scene, frames, events = step
+        current['scene'] = scene
+        current['left'] = frames
+        for event in events:
+            pygame.event.post(event)
+        if trace_memory:
+            tracemalloc.reset_peak()
+
+    def frame_hook(sample):
+        scene = current['scene']
+        if scene is not None:
+            samples.setdefault(scene, []).append(sample)
+            if trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+            else:
+                peak = rss_kb() * 1024
+            peaks[scene] = max(peaks.get(scene, 0), peak)
+            current['left'] -= 1
+        if current['left'] <= 0:
+            start_next_step()
+
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        game.main(frame_hook=frame_hook,
+                  governor=QualityGovernor(min_quality=1.0, max_quality=1.0))
+    except SystemExit:
+        pass
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    results = {}
+    for scene, rows in samples.items():
+        frame_ms = np.array([row['frame_ms'] for row in rows])
+        surfaces = np.array([row.get('surfaces.board', 0) + row.get('surfaces.effects', 0) +
+                             row.get('surfaces.buttons', 0) for row in rows])
+        results[scene] = {
+            'frames': len(rows),
+            'p50_ms': float(np.percentile(frame_ms, 50)),
+            'p95_ms': float(np.percentile(frame_ms, 95)),
+            'p99_ms': float(np.percentile(frame_ms, 99)),
+            'max_ms': float(frame_ms.max()),
+            'surfaces': int(surfaces.sum()),
+            'peak_bytes': peaks[scene],
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scripted game scenes headlessly.")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--json', metavar='PATH', help="also write the results to PATH")
+    args = parser.parse_args(argv)
+
+    results = play()
+    if not args.no_memory:
+        for scene, stats in play(trace_memory=True).items():
+            results[scene]['heap_peak_bytes'] = stats['peak_bytes']
+
+    print(f"{'scene':<12} {'frames':>6} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'max ms':>7} "
+          f"{'surfaces':>8} {'peak RSS':>10} {'heap peak':>10}")
+    for scene, stats in results.items():
+        heap = stats.get('heap_peak_bytes')
+        heap = f"{heap / 1024 / 1024:7.1f} MB" if heap is not None else f"{'-':>10}"
+        print(f"{scene:<12} {stats['frames']:>6} {stats['p50_ms']:7.2f} {stats['p95_ms']:7.2f} "
+              f"{stats['p99_ms']:7.2f} {stats['max_ms']:7.2f} {stats['surfaces']:>8} "
+              f"{stats['peak_bytes'] / 1024 / 1024:7.1f} MB {heap}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
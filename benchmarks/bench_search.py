@@ -0,0 +1,54 @@
+"""
+Compare the negamax engine against a plain minimax walk of the game tree.
+
+Run from the repository root:
+    python -m benchmarks.bench_search
+"""
+import time
+
+from bitboard import Bitboard, CELL_BITS, FULL_MASK, SET_CELLS, WIN_LINE
+from lookup_table import reachable_positions
+from negamax import NegamaxEngine
+from symmetry import canonical
+
+
+def count_raw_nodes(me=0, opp=0):
+    """Count every node of the full game tree, with no pruning or caching."""
+    nodes = 1
+    if WIN_LINE[opp] >= 0:
+        return nodes
+    for cell in SET_CELLS[FULL_MASK & ~(me | opp)]:
+        nodes += count_raw_nodes(opp, me | CELL_BITS[cell])
+    return nodes
+
+
+def main():
+    start = time.perf_counter()
+    raw_nodes = count_raw_nodes()
+    raw_time = time.perf_counter() - start
+
+    engine = NegamaxEngine()
+    start = time.perf_counter()
+    score = engine.solve(Bitboard())
+    cold_time = time.perf_counter() - start
+    cold_nodes = engine.nodes
+
+    engine.nodes = 0
+    start = time.perf_counter()
+    engine.best_moves(Bitboard())
+    warm_time = time.perf_counter() - start
+
+    print(f"Raw game tree:      {raw_nodes:>8} nodes  {raw_time * 1000:8.1f} ms")
+    print(f"Negamax (cold TT):  {cold_nodes:>8} nodes  {cold_time * 1000:8.1f} ms  "
+          f"({cold_nodes / raw_nodes:.2%} of raw), score {score}")
+    print(f"Best moves (warm):  {engine.nodes:>8} nodes  {warm_time * 1000:8.1f} ms")
+    print(f"Transposition table: {len(engine.table)} entries")
+
+    positions = reachable_positions()
+    canonical_positions = {canonical(x, o)[:2] for x, o in positions}
+    print(f"Reachable positions: {len(positions)}, {len(canonical_positions)} up to symmetry "
+          f"({len(positions) / len(canonical_positions):.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
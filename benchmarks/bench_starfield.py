@@ -0,0 +1,45 @@
+"""
+Measure the per-frame cost of updating and drawing the background stars.
+
+Run from the repository root (no window is opened):
+    python -m benchmarks.bench_starfield [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from starfield import Starfield
+
+WIDTH, HEIGHT = 700, 800
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    for count in (200, 1000, 5000, 20000):
+        starfield = Starfield(WIDTH, HEIGHT, count, seed=0)
+        update_time = draw_time = 0.0
+        for _ in range(frames):
+            screen.fill((25, 25, 35))
+            start = time.perf_counter()
+            starfield.update()
+            middle = time.perf_counter()
+            starfield.draw(screen)
+            end = time.perf_counter()
+            update_time += middle - start
+            draw_time += end - middle
+        total = (update_time + draw_time) / frames * 1000
+        print(f"{count:>6} stars: update {update_time / frames * 1000:.3f} ms, "
+              f"draw {draw_time / frames * 1000:.3f} ms, "
+              f"{total:.3f} ms/frame ({total / (1000 / 60):.1%} of a 60 FPS frame)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
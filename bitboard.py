@@ -0,0 +1,291 @@
+"""
+Compact board representation shared by GameBoard and AIPlayer.
+
+Each player's pieces are stored as an int where cell (row, col) is bit
+row * size + col. Win checks and move generation are mask operations on
+those ints instead of loops over lists of strings. The classic 3x3 board
+additionally gets lookup tables over all 512 masks; larger N x N boards
+with K-in-a-row are described by a Geometry.
+"""
+
+BOARD_CELLS = 9
+FULL_MASK = (1 << BOARD_CELLS) - 1
+
+# Winning lines, in the same order as their win_type names
+WIN_MASKS = (
+    0b000000111,  # row0
+    0b000111000,  # row1
+    0b111000000,  # row2
+    0b001001001,  # col0
+    0b010010010,  # col1
+    0b100100100,  # col2
+    0b100010001,  # diag1 (top-left to bottom-right)
+    0b001010100,  # diag2 (top-right to bottom-left)
+)
+WIN_TYPES = ('row0', 'row1', 'row2', 'col0', 'col1', 'col2', 'diag1', 'diag2')
+
+# Bit for each cell and the (row, col) for each bit index
+CELL_BITS = tuple(1 << i for i in range(BOARD_CELLS))
+CELL_COORDS = tuple(divmod(i, 3) for i in range(BOARD_CELLS))
+
+
+def _build_win_table():
+    """For every 9-bit mask, the index of the first line it completes or -1."""
+    table = []
+    for bits in range(1 << BOARD_CELLS):
+        line = -1
+        for idx, mask in enumerate(WIN_MASKS):
+            if bits & mask == mask:
+                line = idx
+                break
+        table.append(line)
+    return tuple(table)
+
+
+def _build_cell_table():
+    """For every 9-bit mask, the tuple of bit indices that are set."""
+    return tuple(
+        tuple(i for i in range(BOARD_CELLS) if bits >> i & 1)
+        for bits in range(1 << BOARD_CELLS)
+    )
+
+
+WIN_LINE = _build_win_table()
+SET_CELLS = _build_cell_table()
+
+
+def is_win(bits):
+    """Check if a player's bits complete any winning line on the 3x3 board."""
+    return WIN_LINE[bits] >= 0
+
+
+def iter_bits(mask):
+    """Yield the index of every set bit in mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Geometry:
+    """
+    Cells and winning lines of an N x N board where K in a row wins.
+
+    Every run of K cells along a row, column or diagonal is a line. Lines
+    are named like the classic board when K == N ('row0', 'col2', 'diag1',
+    'diag2'); shorter lines also carry their first cell ('row3_1' is the
+    run in row 3 that starts at column 1, 'diag2_0_4' the anti-diagonal
+    run that starts at row 0, column 4).
+    """
+    def __init__(self, size, win_length):
+        self.size = size
+        self.win_length = win_length
+        self.cell_count = size * size
+        self.full_mask = (1 << self.cell_count) - 1
+        self.cell_bits = tuple(1 << i for i in range(self.cell_count))
+        self.cell_coords = tuple(divmod(i, size) for i in range(self.cell_count))
+        self.center = (size // 2) * size + size // 2
+
+        # Winning lines: (direction name, row step, col step)
+        self.line_masks = []
+        self.win_types = []
+        self.endpoints = {}  # {win_type: ((row, col), (row, col))}
+        k = win_length
+        for name, dr, dc in (('row', 0, 1), ('col', 1, 0), ('diag1', 1, 1), ('diag2', 1, -1)):
+            for start_row in range(size):
+                for start_col in range(size):
+                    end_row = start_row + dr * (k - 1)
+                    end_col = start_col + dc * (k - 1)
+                    if not (0 <= end_row < size and 0 <= end_col < size):
+                        continue
+                    mask = 0
+                    for i in range(k):
+                        mask |= 1 << ((start_row + dr * i) * size + start_col + dc * i)
+                    win_type = self._win_type(name, start_row, start_col)
+                    self.line_masks.append(mask)
+                    self.win_types.append(win_type)
+                    self.endpoints[win_type] = ((start_row, start_col), (end_row, end_col))
+        self.line_masks = tuple(self.line_masks)
+        self.win_types = tuple(self.win_types)
+
+        # Lines through each cell, for checking only around the last move
+        through = [[] for _ in range(self.cell_count)]
+        for idx, mask in enumerate(self.line_masks):
+            for cell in iter_bits(mask):
+                through[cell].append(idx)
+        self.lines_through = tuple(tuple(lines) for lines in through)
+
+        # Column masks used to stop shifts wrapping across rows
+        self._not_first_col = 0
+        self._not_last_col = 0
+        for cell, (row, col) in enumerate(self.cell_coords):
+            if col != 0:
+                self._not_first_col |= 1 << cell
+            if col != size - 1:
+                self._not_last_col |= 1 << cell
+
+    def _win_type(self, name, row, col):
+        """Name a line by its direction and first cell."""
+        if self.win_length == self.size:
+            if name == 'row':
+                return f'row{row}'
+            if name == 'col':
+                return f'col{col}'
+            return name
+        if name == 'row':
+            return f'row{row}_{col}'
+        if name == 'col':
+            return f'col{col}_{row}'
+        return f'{name}_{row}_{col}'
+
+    def winning_line(self, bits):
+        """Return the index of a line completed by bits, scanning every line, or -1."""
+        for idx, mask in enumerate(self.line_masks):
+            if bits & mask == mask:
+                return idx
+        return -1
+
+    def winning_line_at(self, bits, cell):
+        """Return the index of a line through cell completed by bits, or -1."""
+        for idx in self.lines_through[cell]:
+            mask = self.line_masks[idx]
+            if bits & mask == mask:
+                return idx
+        return -1
+
+    def neighbors(self, mask):
+        """Return mask grown by one cell in every direction, diagonals included."""
+        size = self.size
+        grown = mask | (mask << size) | (mask >> size)
+        grown |= ((grown << 1) & self._not_first_col) | ((grown >> 1) & self._not_last_col)
+        return grown & self.full_mask
+
+    def candidates(self, occupied):
+        """
+        Return the mask of empty cells worth searching: those next to a
+        piece, the center on an empty board, or every empty cell if none
+        is next to a piece.
+        """
+        if not occupied:
+            return self.cell_bits[self.center]
+        candidates = self.neighbors(occupied) & ~occupied
+        if not candidates:
+            candidates = self.full_mask & ~occupied
+        return candidates
+
+
+_geometries = {}
+
+
+def get_geometry(size=3, win_length=None):
+    """Return the shared Geometry for an N x N board (K defaults to N)."""
+    key = (size, win_length or size)
+    if key not in _geometries:
+        _geometries[key] = Geometry(*key)
+    return _geometries[key]
+
+
+CLASSIC = get_geometry(3, 3)
+
+
+class Bitboard:
+    """A position as two ints, one per player, on a board of the given Geometry."""
+    __slots__ = ('x', 'o', 'geometry')
+
+    def __init__(self, x=0, o=0, geometry=CLASSIC):
+        self.x = x
+        self.o = o
+        self.geometry = geometry
+
+    @classmethod
+    def from_rows(cls, rows, win_length=None):
+        """Build a bitboard from a list-of-lists board of '', 'X' and 'O'."""
+        geometry = get_geometry(len(rows), win_length)
+        x = o = 0
+        for row, values in enumerate(rows):
+            for col, value in enumerate(values):
+                if value == 'X':
+                    x |= geometry.cell_bits[row * geometry.size + col]
+                elif value == 'O':
+                    o |= geometry.cell_bits[row * geometry.size + col]
+        return cls(x, o, geometry)
+
+    def to_rows(self):
+        """Return the list-of-lists view of this board."""
+        size = self.geometry.size
+        rows = [[''] * size for _ in range(size)]
+        for idx in iter_bits(self.x):
+            rows[idx // size][idx % size] = 'X'
+        for idx in iter_bits(self.o):
+            rows[idx // size][idx % size] = 'O'
+        return rows
+
+    def copy(self):
+        """Return a copy of this board."""
+        return Bitboard(self.x, self.o, self.geometry)
+
+    def bits(self, symbol):
+        """Return the bits belonging to the given symbol."""
+        return self.x if symbol == 'X' else self.o
+
+    def occupied(self):
+        """Return the bits of every filled cell."""
+        return self.x | self.o
+
+    def sides(self):
+        """Return (bits of the player to move, bits of the other player); X moves first."""
+        if self.x.bit_count() == self.o.bit_count():
+            return self.x, self.o
+        return self.o, self.x
+
+    def get(self, row, col):
+        """Return the symbol at a cell, or '' if it is empty."""
+        bit = self.geometry.cell_bits[row * self.geometry.size + col]
+        if self.x & bit:
+            return 'X'
+        if self.o & bit:
+            return 'O'
+        return ''
+
+    def place(self, row, col, symbol):
+        """Put a symbol on an empty cell. Returns False if it is taken."""
+        bit = self.geometry.cell_bits[row * self.geometry.size + col]
+        if (self.x | self.o) & bit:
+            return False
+        if symbol == 'X':
+            self.x |= bit
+        else:
+            self.o |= bit
+        return True
+
+    def empty_cells(self):
+        """Return the (row, col) of every empty cell."""
+        geometry = self.geometry
+        empty = geometry.full_mask & ~(self.x | self.o)
+        if geometry is CLASSIC:
+            return [CELL_COORDS[idx] for idx in SET_CELLS[empty]]
+        return [geometry.cell_coords[idx] for idx in iter_bits(empty)]
+
+    def is_full(self):
+        """Check if the board is full."""
+        return self.x | self.o == self.geometry.full_mask
+
+    def winner(self):
+        """
+        Check if there's a winner by scanning every line.
+        Returns a tuple (winner, win_type) like GameBoard.check_winner.
+        """
+        geometry = self.geometry
+        if geometry is CLASSIC:
+            line = WIN_LINE[self.x]
+            if line >= 0:
+                return 'X', WIN_TYPES[line]
+            line = WIN_LINE[self.o]
+            if line >= 0:
+                return 'O', WIN_TYPES[line]
+            return None, None
+        for symbol, bits in (('X', self.x), ('O', self.o)):
+            line = geometry.winning_line(bits)
+            if line >= 0:
+                return symbol, geometry.win_types[line]
+        return None, None
@@ -1,25 +1,43 @@
 import pygame
 import math
+from sprite_cache import shared_cache
 
 class ButtonEffects:
+    """
+    Buttons with shadows, press states and a pulsing hover glow. update()
+    advances the pulse one fixed simulation tick; begin_frame() starts a
+    frame of draw_button() calls, alpha of the way through the last tick.
+    """
     def __init__(self):
         # Button style constants
         self.shadow_offset = 5
         self.shadow_alpha = 100
         self.pulse_speed = 0.015  # Reduced from 0.03 for smoother animation
         self.hover_glow_size = 8  # Reduced from 10 for subtler effect
+        self.pulse_steps = 8  # Distinct glow sizes, so hovered buttons can be cached
+        self.glow_layer_spacing = 2  # Pixels between hover glow layers (see QualityGovernor)
         
         # Animation states
         self.pulse_factor = 0
         self.pulse_direction = 1
+        self.previous_pulse_factor = 0  # Before the last update(), for interpolation
+        self.drawn_pulse_factor = 0  # Interpolated for this frame's draw_button() calls
         self.hover_buttons = set()  # Track button coordinates instead of Rect objects
         self.selected_buttons = set()  # Track selected buttons
         
         # Colors
         self.glow_color = (255, 255, 255, 80)  # Semi-transparent white
+        self.sprites = shared_cache()
+        
+        # Screen regions animated since the last begin_frame() (see RenderPipeline)
+        self.dirty_rects = []
+        # Surfaces created while drawing, in total (see FrameProfiler.count)
+        self.surfaces_allocated = 0
     
     def update(self):
-        """Update all animation states."""
+        """Advance all animation states by one tick."""
+        self.previous_pulse_factor = self.pulse_factor
+        
         # Update pulse effect
         self.pulse_factor += self.pulse_speed * self.pulse_direction
         if self.pulse_factor > 1:
@@ -29,13 +47,15 @@ class ButtonEffects:
             self.pulse_factor = 0
             self.pulse_direction = 1
     
+    def begin_frame(self, alpha=1.0):
+        """Start a frame of drawing, alpha of the way through the last tick."""
+        self.dirty_rects = []
+        self.drawn_pulse_factor = self.previous_pulse_factor + (
+            self.pulse_factor - self.previous_pulse_factor) * alpha
+    
     def draw_button(self, surface, rect, color, text, text_color, font, 
                     border_radius=10, is_hovered=False, is_active=False, is_selected=False):
         """Draw a button with hover and active states."""
-        # Create button surfaces
-        button_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        shadow_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        
         # Track if this button is being hovered using tuple of coordinates
         button_key = (rect.x, rect.y, rect.width, rect.height)
         if is_hovered and button_key not in self.hover_buttons:
@@ -49,16 +69,55 @@ class ButtonEffects:
         elif button_key in self.selected_buttons:
             self.selected_buttons.remove(button_key)
         
-        # Draw shadow first (more prominent when button is active)
+        # Hover glow (only if not selected), snapped to one of pulse_steps sizes
+        glow_step = None
+        if is_hovered and not is_selected:
+            glow_step = round(self.drawn_pulse_factor * (self.pulse_steps - 1))
+            glow_size = self._glow_size(glow_step)
+            # The glow pulses, so its area always needs presenting
+            glow_rect = pygame.Rect(
+                rect.x - glow_size,
+                rect.y - glow_size,
+                rect.width + glow_size * 2,
+                rect.height + glow_size * 2
+            )
+            self.dirty_rects.append(glow_rect.inflate(2, 2))
+        
+        # Every sprite cache miss below renders a new surface
+        cache_misses = self.sprites.misses
+        
+        # Draw shadow first (more prominent when button is active); it is a
+        # separate blit so the glow blends over it exactly as on screen
         shadow_offset = self.shadow_offset * (1.5 if is_active else 1)
         shadow_alpha = self.shadow_alpha * (1.2 if is_active else 1)
-        
-        # Softer shadow effect
-        pygame.draw.rect(shadow_surface, (0, 0, 0, shadow_alpha), 
-                        (0, 0, rect.width, rect.height), 
-                        border_radius=border_radius)
+        shadow_surface = self.sprites.rect(rect.width, rect.height, (0, 0, 0, shadow_alpha),
+                                           border_radius=border_radius)
         surface.blit(shadow_surface, (rect.x + shadow_offset//2, rect.y + shadow_offset//2))
         
+        # The body, glow and label of every visual state are composed once.
+        # A different size, color or label is a different key, so images
+        # for old rects and colors just age out of the cache
+        key = ('button', rect.width, rect.height, tuple(color), text, tuple(text_color), font,
+               border_radius, is_active, is_selected, glow_step, self.glow_layer_spacing)
+        image = self.sprites.get(key, lambda: self._compose_button(
+            rect.size, color, text, text_color, font, border_radius, is_active, is_selected, glow_step))
+        margin = self.hover_glow_size
+        surface.blit(image, (rect.x - margin, rect.y - margin))
+        self.surfaces_allocated += self.sprites.misses - cache_misses
+    
+    def _glow_size(self, glow_step):
+        """Return the hover glow size for a pulse step."""
+        pulse = glow_step / (self.pulse_steps - 1)
+        return self.hover_glow_size * (0.5 + pulse * 0.5)
+    
+    def _compose_button(self, size, color, text, text_color, font, border_radius,
+                        is_active, is_selected, glow_step):
+        """Render a button's body, glow and label onto one surface."""
+        width, height = size
+        margin = self.hover_glow_size
+        image = pygame.Surface((width + margin * 2, height + margin * 2), pygame.SRCALPHA)
+        rect = pygame.Rect(margin, margin, width, height)
+        
         # Button color modifications
         button_color = color
         if is_selected:
@@ -69,31 +128,24 @@ class ButtonEffects:
             button_color = tuple(max(c - 30, 0) for c in color)
         
         # Draw the main button
-        pygame.draw.rect(button_surface, button_color, 
-                        (0, 0, rect.width, rect.height), 
-                        border_radius=border_radius)
+        pygame.draw.rect(image, button_color, rect, border_radius=border_radius)
         
         # Add borders
         if is_selected:
             # Draw white border for selected state
-            pygame.draw.rect(button_surface, (255, 255, 255), 
-                           (0, 0, rect.width, rect.height), 
+            pygame.draw.rect(image, (255, 255, 255), rect, 
                            width=3, border_radius=border_radius)
         else:
             border_color = (0, 0, 0) if is_active else (50, 50, 50)
-            pygame.draw.rect(button_surface, border_color, 
-                           (0, 0, rect.width, rect.height), 
+            pygame.draw.rect(image, border_color, rect, 
                            width=2, border_radius=border_radius)
         
-        # Draw the button to the surface
-        surface.blit(button_surface, (rect.x, rect.y))
-        
-        # Add hover effect (only if not selected)
-        if is_hovered and not is_selected:
-            self._draw_hover_effect(surface, rect, border_radius)
+        # Add hover effect
+        if glow_step is not None:
+            self._draw_hover_effect(image, rect, border_radius, self._glow_size(glow_step))
         
         # Draw text
-        text_surface = font.render(text, True, text_color)
+        text_surface = self.sprites.text(font, text, True, text_color)
         text_rect = text_surface.get_rect(center=rect.center)
         
         # Apply a slight offset when button is active (pressed)
@@ -101,14 +153,12 @@ class ButtonEffects:
             text_rect.x += 1
             text_rect.y += 1
             
-        surface.blit(text_surface, text_rect)
+        image.blit(text_surface, text_rect)
+        return image
     
-    def _draw_hover_effect(self, surface, rect, border_radius):
-        """Draw a pulsing glow effect around the button when hovered."""
-        # Calculate pulse size
-        glow_size = self.hover_glow_size * (0.5 + self.pulse_factor * 0.5)
-        
-        # Create a larger surface for the glow
+    def _draw_hover_effect(self, surface, rect, border_radius, glow_size):
+        """Draw a glow effect of the given size around the button."""
+        # Area covered by the glow
         glow_rect = pygame.Rect(
             rect.x - glow_size,
             rect.y - glow_size,
@@ -117,26 +167,19 @@ class ButtonEffects:
         )
         
         # Draw glow using multiple semi-transparent rectangles
-        for i in range(int(glow_size), 0, -2):
+        for i in range(int(glow_size), 0, -self.glow_layer_spacing):
             alpha = 100 - (i * 7)
             if alpha < 0:
                 continue
                 
-            glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-            current_glow = pygame.Rect(
-                i, i, 
-                glow_rect.width - i*2, 
-                glow_rect.height - i*2
-            )
-            
             # Adjust radius for the glow
             current_radius = border_radius + (glow_size - i)
             
-            pygame.draw.rect(
-                glow_surface, 
-                (*self.glow_color[:3], alpha), 
-                current_glow, 
+            glow_surface = self.sprites.rect(
+                glow_rect.width - i*2,
+                glow_rect.height - i*2,
+                (*self.glow_color[:3], alpha),
                 border_radius=int(current_radius)
             )
             
-            surface.blit(glow_surface, (glow_rect.x, glow_rect.y))
\ No newline at end of file
+            surface.blit(glow_surface, (glow_rect.x + i, glow_rect.y + i))
@@ -0,0 +1,175 @@
+"""
+Per-frame timing and allocation counters for the game loop.
+
+Each frame runs from begin_frame() to end_frame(). Code is bracketed
+with start(name) / stop(name) (or the scope(name) context manager); time
+spent in a name is summed over the frame, and end_frame() files the
+totals into a rolling window per name from which p50/p95/p99 are
+reported. Counters such as surfaces allocated
+are read from cumulative totals and recorded as per-frame deltas.
+
+Frames can also be streamed to a file for offline analysis: CSV when the
+path ends in .csv, JSON lines otherwise. Names passed to the constructor
+appear in every sample (as 0 in frames that skip them), which keeps CSV
+columns stable; other names only make it into CSV if the first frame
+has them.
+"""
+import csv
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pygame
+
+
+class FrameProfiler:
+    def __init__(self, names=(), window=300):
+        self.names = tuple(names)
+        self.window = window
+        self.frame_index = 0
+        self.timings = {}    # name -> deque of per-frame milliseconds
+        self.counters = {}   # name -> deque of per-frame counts
+
+        # Current frame
+        self._frame_start = time.perf_counter()
+        self._started = {}
+        self._frame_times = {}
+        self._frame_counts = {}
+        self._totals = {}
+
+        # Overlay
+        self.overlay_visible = False
+        self.overlay_refresh = 15  # Frames between re-rendering the numbers
+        self.overlay_position = (10, 10)
+        self._overlay_lines = []
+
+        # Exporter
+        self._export_file = None
+        self._csv = False
+        self._csv_writer = None
+
+    def begin_frame(self):
+        """Mark the start of a frame's work (so frame_ms excludes waiting on the clock)."""
+        self._frame_start = time.perf_counter()
+
+    def start(self, name):
+        """Start timing name."""
+        self._started[name] = time.perf_counter()
+
+    def stop(self, name):
+        """Stop timing name, adding the elapsed time to this frame's total."""
+        elapsed = time.perf_counter() - self._started.pop(name)
+        self._frame_times[name] = self._frame_times.get(name, 0.0) + elapsed
+
+    @contextmanager
+    def scope(self, name):
+        """Time the body of a with block under name."""
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop(name)
+
+    def count(self, name, total):
+        """
+        Record how much a cumulative counter grew since the last frame. A
+        total lower than last time means its owner was replaced, and
+        counts as growth from zero.
+        """
+        previous = self._totals.get(name, total)
+        self._totals[name] = total
+        grown = total - previous if total >= previous else total
+        self._frame_counts[name] = self._frame_counts.get(name, 0) + grown
+
+    def end_frame(self):
+        """File this frame's timings and counts and start the next frame."""
+        now = time.perf_counter()
+        sample = {'frame': self.frame_index, 'frame_ms': (now - self._frame_start) * 1000}
+        sample.update(dict.fromkeys(self.names, 0))
+        self._record(self.timings, 'frame', sample['frame_ms'])
+        for name, seconds in self._frame_times.items():
+            sample[name] = seconds * 1000
+            self._record(self.timings, name, seconds * 1000)
+        for name, amount in self._frame_counts.items():
+            sample[name] = amount
+            self._record(self.counters, name, amount)
+        if self._export_file is not None:
+            self._write_sample(sample)
+
+        self.frame_index += 1
+        self._frame_start = now  # In case begin_frame() isn't called
+        self._frame_times = {}
+        self._frame_counts = {}
+        return sample
+
+    def percentiles(self, name):
+        """Return the (p50, p95, p99) of name over the window, or None if unseen."""
+        samples = self.timings.get(name) or self.counters.get(name)
+        if not samples:
+            return None
+        return tuple(np.percentile(samples, (50, 95, 99)))
+
+    def report(self):
+        """Return one text line per timing and counter."""
+        lines = []
+        for name in self.timings:
+            p50, p95, p99 = self.percentiles(name)
+            lines.append(f"{name:<16} p50 {p50:6.2f}  p95 {p95:6.2f}  p99 {p99:6.2f} ms")
+        for name, samples in self.counters.items():
+            p50, p95, p99 = self.percentiles(name)
+            lines.append(f"{name:<16} p50 {p50:6.0f}  p95 {p95:6.0f}  p99 {p99:6.0f}  max {max(samples):.0f}")
+        return lines
+
+    def draw_overlay(self, surface, font):
+        """
+        Draw the report in a corner of surface if the overlay is visible.
+        Returns the area drawn, or None.
+        """
+        if not self.overlay_visible:
+            return None
+        if self.frame_index % self.overlay_refresh == 0 or not self._overlay_lines:
+            self._overlay_lines = [font.render(line, True, (255, 255, 255)) for line in self.report()]
+        if not self._overlay_lines:
+            return None
+
+        x, y = self.overlay_position
+        line_height = font.get_linesize()
+        width = max(line.get_width() for line in self._overlay_lines) + 12
+        height = line_height * len(self._overlay_lines) + 12
+        area = pygame.Rect(x, y, width, height)
+        surface.fill((0, 0, 0), area)
+        for i, line in enumerate(self._overlay_lines):
+            surface.blit(line, (x + 6, y + 6 + i * line_height))
+        return area
+
+    def export(self, path):
+        """Stream every following frame's sample to path (CSV or JSON lines)."""
+        self.close()
+        self._export_file = open(path, 'w', newline='')
+        self._csv_writer = None
+        self._csv = path.endswith('.csv')
+
+    def close(self):
+        """Stop exporting and close the file."""
+        if self._export_file is not None:
+            self._export_file.close()
+            self._export_file = None
+            self._csv_writer = None
+
+    def _record(self, table, name, value):
+        samples = table.get(name)
+        if samples is None:
+            samples = table[name] = deque(maxlen=self.window)
+        samples.append(value)
+
+    def _write_sample(self, sample):
+        if not self._csv:
+            self._export_file.write(json.dumps(sample) + '\n')
+            return
+        if self._csv_writer is None:
+            self._csv_writer = csv.DictWriter(self._export_file, fieldnames=list(sample),
+                                              restval=0, extrasaction='ignore')
+            self._csv_writer.writeheader()
+        self._csv_writer.writerow(sample)
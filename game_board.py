@@ -1,13 +1,22 @@
 import pygame
 import math
+from bitboard import get_geometry
+from game_state import GameState
 
 class GameBoard:
-    def __init__(self, x, y, size):
+    def __init__(self, x, y, size, grid_size=3, win_length=None):
         self.x = x
         self.y = y
         self.size = size
-        self.cell_size = size // 3
-        self.board = [['', '', ''], ['', '', ''], ['', '', '']]
+        # Number of cells per side and how many in a row win (defaults to a full line)
+        self.grid_size = grid_size
+        self.geometry = get_geometry(grid_size, win_length)
+        self.win_length = self.geometry.win_length
+        self.cell_size = size // grid_size
+        # Rules state with per-line counters, updated incrementally as moves are made
+        self.state = GameState(self.geometry)
+        # List view of the bitboard, kept in sync for rendering
+        self.board = [[''] * grid_size for _ in range(grid_size)]
         
         # Colors
         self.line_color = (80, 80, 80)
@@ -17,115 +26,214 @@ class GameBoard:
         self.board_bg_color = (255, 255, 255)
         self.cell_bg_color = (248, 248, 248)
         
-        # Line thickness
-        self.line_thickness = 8
-        self.symbol_thickness = 10
+        # Line thickness (scaled so a 3x3 board gets 8 and 10)
+        self.line_thickness = max(2, self.cell_size // 20)
+        self.symbol_thickness = max(2, self.cell_size // 16)
         
         # Padding for X and O
-        self.symbol_padding = 20
+        self.symbol_padding = max(3, self.cell_size // 8)
         
         # Animation properties
         self.draw_X_progress = {}  # {(row, col): progress}
         self.draw_O_progress = {}  # {(row, col): progress}
-        self.animation_speed = 0.05
+        self.animation_speed = 0.05  # Progress per simulation tick
+        self._settled_cells = []  # Finished since the last draw(), still to be presented
+        
+        # Screen regions that changed in the last draw() (see RenderPipeline)
+        self.dirty_rects = []
+        # Surfaces created for the cached layers, in total (see FrameProfiler.count)
+        self.surfaces_allocated = 0
+        
+        # Pre-rendered layers: background/grid, and the same with settled symbols
+        self.shadow_offset = 10
+        self._static_surface = None
+        self._board_surface = None
+        self._cache_key = None
+        
+        # Sprite atlas of X (top row) and O (bottom row) animation frames,
+        # one cell-sized frame per progress step from 0 to 1
+        self.atlas_steps = 20
+        self._atlas = None
         
     def reset(self):
         """Reset the board to its initial state."""
-        self.board = [['', '', ''], ['', '', ''], ['', '', '']]
+        self.state.reset()
+        self.board = [[''] * self.grid_size for _ in range(self.grid_size)]
         self.draw_X_progress = {}
         self.draw_O_progress = {}
+        self._settled_cells = []
+        if self._static_surface is not None:
+            self._rebuild_board_surface()
     
-    def draw(self, surface, animation=None):
-        """Draw the board on the given surface."""
-        # Draw board background with shadow
-        shadow_offset = 10
-        shadow_surface = pygame.Surface((self.size + shadow_offset, self.size + shadow_offset))
-        shadow_surface.fill((0, 0, 0, 0))
-        shadow_surface.set_alpha(30)
-        pygame.draw.rect(shadow_surface, (0, 0, 0), 
-                         (0, 0, self.size + shadow_offset, self.size + shadow_offset), 
-                         border_radius=15)
-        surface.blit(shadow_surface, (self.x - shadow_offset//2, self.y - shadow_offset//2))
+    def draw(self, surface, animation=None, mouse_pos=None, alpha=1.0):
+        """
+        Draw the board on the given surface, highlighting the empty cell
+        under mouse_pos (the current mouse position if not given).
+        Animations are drawn alpha of the way through the last tick.
+        """
+        self.dirty_rects = []
         
-        # Draw main board background
-        pygame.draw.rect(surface, self.board_bg_color, 
-                         (self.x, self.y, self.size, self.size), 
-                         border_radius=10)
+        # Rebuild the cached layers if the size or colors changed
+        if self._cache_key != self._get_cache_key():
+            self._build_static_surface()
         
-        # Draw cells with subtle background
-        for row in range(3):
-            for col in range(3):
-                cell_x = self.x + col * self.cell_size
-                cell_y = self.y + row * self.cell_size
-                
-                # Draw cell background
-                pygame.draw.rect(surface, self.cell_bg_color,
-                                (cell_x + 3, cell_y + 3, 
-                                 self.cell_size - 6, self.cell_size - 6),
-                                border_radius=5)
-        
-        # Draw grid lines
-        for i in range(1, 3):
-            # Vertical lines
-            pygame.draw.line(surface, self.line_color, 
-                             (self.x + i * self.cell_size, self.y + 5),
-                             (self.x + i * self.cell_size, self.y + self.size - 5),
-                             self.line_thickness)
-            
-            # Horizontal lines
-            pygame.draw.line(surface, self.line_color, 
-                             (self.x + 5, self.y + i * self.cell_size),
-                             (self.x + self.size - 5, self.y + i * self.cell_size),
-                             self.line_thickness)
+        # Background, shadow, grid and settled symbols in one blit
+        surface.blit(self._board_surface, (self.x - self.shadow_offset // 2, self.y - self.shadow_offset // 2))
         
-        # Update and draw X's and O's with animation
-        self._update_animations()
+        # Symbols that just settled change one last time
+        for pos in self._settled_cells:
+            self._mark_cell(*pos)
+        self._settled_cells = []
         
-        for row in range(3):
-            for col in range(3):
-                cell_x = self.x + col * self.cell_size
-                cell_y = self.y + row * self.cell_size
-                
-                # Draw symbols with animation
-                if self.board[row][col] == 'X':
-                    progress = self.draw_X_progress.get((row, col), 1.0)
-                    self._draw_x_animated(surface, cell_x, cell_y, progress)
-                elif self.board[row][col] == 'O':
-                    progress = self.draw_O_progress.get((row, col), 1.0)
-                    self._draw_o_animated(surface, cell_x, cell_y, progress)
+        # Draw the symbols that are still animating (progress is linear, so
+        # stepping back part of a tick interpolates exactly)
+        rewind = self.animation_speed * (1 - alpha)
+        for symbol, progresses in (('X', self.draw_X_progress), ('O', self.draw_O_progress)):
+            for (row, col), progress in progresses.items():
+                self._mark_cell(row, col)
+                self._blit_symbol_frame(surface, symbol, self.x + col * self.cell_size,
+                                        self.y + row * self.cell_size, progress - rewind)
                 
         # Draw hover effect
         if not self.is_full() and not self.check_winner()[0]:
-            mouse_pos = pygame.mouse.get_pos()
+            if mouse_pos is None:
+                mouse_pos = pygame.mouse.get_pos()
             cell = self._get_cell_from_pos(mouse_pos)
             if cell:
                 row, col = cell
                 # Make sure row and col are valid indices
-                if 0 <= row < 3 and 0 <= col < 3 and self.board[row][col] == '':
+                if self.board[row][col] == '':
                     cell_x = self.x + col * self.cell_size
                     cell_y = self.y + row * self.cell_size
                     
+                    # The hover highlight pulses up to 5% past the cell
+                    pulse_margin = self.cell_size // 10 + 1
+                    self.dirty_rects.append(pygame.Rect(
+                        cell_x - pulse_margin, cell_y - pulse_margin,
+                        self.cell_size + 2 * pulse_margin, self.cell_size + 2 * pulse_margin
+                    ))
+                    
                     if animation:
                         # Use animated hover effect if animation object is provided
-                        animation.draw_hover_effect(surface, cell_x, cell_y, self.cell_size)
+                        animation.draw_hover_effect(surface, cell_x, cell_y, self.cell_size, alpha)
                     else:
                         # Fallback to simple hover effect
                         pygame.draw.rect(surface, self.highlight_color, 
                                         (cell_x, cell_y, self.cell_size, self.cell_size), 0)
     
-    def _update_animations(self):
-        """Update all animation progresses."""
+    def update(self):
+        """Advance the symbol animations by one simulation tick."""
         # Update X drawing animations
         for pos in list(self.draw_X_progress.keys()):
             self.draw_X_progress[pos] += self.animation_speed
             if self.draw_X_progress[pos] >= 1.0:
-                self.draw_X_progress[pos] = 1.0
+                # Finished: draw it once into the cached board
+                del self.draw_X_progress[pos]
+                self._bake_symbol(*pos)
+                self._settled_cells.append(pos)
         
         # Update O drawing animations
         for pos in list(self.draw_O_progress.keys()):
             self.draw_O_progress[pos] += self.animation_speed
             if self.draw_O_progress[pos] >= 1.0:
-                self.draw_O_progress[pos] = 1.0
+                del self.draw_O_progress[pos]
+                self._bake_symbol(*pos)
+                self._settled_cells.append(pos)
+    
+    def _get_cache_key(self):
+        """Everything the cached board layers depend on."""
+        return (self.size, self.cell_size, self.grid_size, self.line_color, self.x_color,
+                self.o_color, self.board_bg_color, self.cell_bg_color, self.line_thickness,
+                self.symbol_thickness, self.symbol_padding, self.shadow_offset)
+    
+    def _build_static_surface(self):
+        """Pre-render the shadow, background, cells and grid lines."""
+        margin = self.shadow_offset // 2
+        surface_size = self.size + self.shadow_offset
+        static = pygame.Surface((surface_size, surface_size), pygame.SRCALPHA)
+        self.surfaces_allocated += 1
+        
+        # Board shadow
+        static.fill((0, 0, 0, 30))
+        
+        # Draw main board background
+        pygame.draw.rect(static, self.board_bg_color, 
+                         (margin, margin, self.size, self.size), 
+                         border_radius=10)
+        
+        # Draw cells with subtle background
+        for row in range(self.grid_size):
+            for col in range(self.grid_size):
+                cell_x = margin + col * self.cell_size
+                cell_y = margin + row * self.cell_size
+                
+                # Draw cell background
+                pygame.draw.rect(static, self.cell_bg_color,
+                                (cell_x + 3, cell_y + 3, 
+                                 self.cell_size - 6, self.cell_size - 6),
+                                border_radius=5)
+        
+        # Draw grid lines
+        for i in range(1, self.grid_size):
+            # Vertical lines
+            pygame.draw.line(static, self.line_color, 
+                             (margin + i * self.cell_size, margin + 5),
+                             (margin + i * self.cell_size, margin + self.size - 5),
+                             self.line_thickness)
+            
+            # Horizontal lines
+            pygame.draw.line(static, self.line_color, 
+                             (margin + 5, margin + i * self.cell_size),
+                             (margin + self.size - 5, margin + i * self.cell_size),
+                             self.line_thickness)
+        
+        self._static_surface = static
+        self._cache_key = self._get_cache_key()
+        self._build_atlas()
+        self._rebuild_board_surface()
+    
+    def _build_atlas(self):
+        """Pre-render every animation frame of X and O into one surface."""
+        frames = self.atlas_steps + 1
+        self._atlas = pygame.Surface((frames * self.cell_size, 2 * self.cell_size), pygame.SRCALPHA)
+        self.surfaces_allocated += 1
+        for step in range(frames):
+            progress = step / self.atlas_steps
+            self._draw_x_animated(self._atlas, step * self.cell_size, 0, progress)
+            self._draw_o_animated(self._atlas, step * self.cell_size, self.cell_size, progress)
+    
+    def _blit_symbol_frame(self, surface, symbol, x, y, progress):
+        """Draw a symbol at the given progress with a single blit from the atlas."""
+        step = min(self.atlas_steps, max(0, round(progress * self.atlas_steps)))
+        atlas_row = 0 if symbol == 'X' else 1
+        surface.blit(self._atlas, (x, y),
+                     (step * self.cell_size, atlas_row * self.cell_size, self.cell_size, self.cell_size))
+    
+    def _rebuild_board_surface(self):
+        """Start the board layer from the static layer and bake every settled symbol."""
+        self._board_surface = self._static_surface.copy()
+        self.surfaces_allocated += 1
+        for row in range(self.grid_size):
+            for col in range(self.grid_size):
+                if (self.board[row][col] and (row, col) not in self.draw_X_progress and
+                        (row, col) not in self.draw_O_progress):
+                    self._bake_symbol(row, col)
+    
+    def _bake_symbol(self, row, col):
+        """Draw a finished symbol into the cached board layer."""
+        if self._board_surface is None:
+            return
+        margin = self.shadow_offset // 2
+        if self.board[row][col]:
+            self._blit_symbol_frame(self._board_surface, self.board[row][col],
+                                    margin + col * self.cell_size, margin + row * self.cell_size, 1.0)
+    
+    def _mark_cell(self, row, col):
+        """Record a cell as changed in this frame's dirty rects."""
+        self.dirty_rects.append(pygame.Rect(
+            self.x + col * self.cell_size, self.y + row * self.cell_size,
+            self.cell_size, self.cell_size
+        ))
     
     def _draw_x_animated(self, surface, x, y, progress):
         """Draw an X with animation progress."""
@@ -238,32 +346,33 @@ class GameBoard:
         col = (x - self.x) // self.cell_size
         row = (y - self.y) // self.cell_size
         
-        # Ensure row and col are within valid range (0-2)
-        if 0 <= row < 3 and 0 <= col < 3:
+        # Ensure row and col are within valid range
+        if 0 <= row < self.grid_size and 0 <= col < self.grid_size:
             return row, col
         
         return None
     
+    @property
+    def bitboard(self):
+        """The current position as a Bitboard."""
+        return self.state.bitboard
+    
     def make_move(self, pos, symbol):
-        """Make a move at the position with the given symbol."""
+        """
+        Make a move at the position with the given symbol.
+        Returns a MoveResult (winner, win_type, is_draw), or None if the
+        position isn't on an empty cell.
+        """
         cell = self._get_cell_from_pos(pos)
         if cell:
             row, col = cell
-            if self.board[row][col] == '':
-                self.board[row][col] = symbol
-                
-                # Start animation for the new symbol
-                if symbol == 'X':
-                    self.draw_X_progress[(row, col)] = 0.0
-                elif symbol == 'O':
-                    self.draw_O_progress[(row, col)] = 0.0
-                
-                return True
-        return False
+            return self.set_cell(row, col, symbol)
+        return None
     
     def set_cell(self, row, col, symbol):
-        """Set the value of a cell directly."""
-        if 0 <= row < 3 and 0 <= col < 3 and self.board[row][col] == '':
+        """Set the value of a cell directly. Returns a MoveResult or None."""
+        result = self.state.place(row, col, symbol)
+        if result:
             self.board[row][col] = symbol
             
             # Start animation for the new symbol
@@ -272,19 +381,23 @@ class GameBoard:
             elif symbol == 'O':
                 self.draw_O_progress[(row, col)] = 0.0
                 
-            return True
-        return False
+        return result
+    
+    def get_win_endpoints(self, win_type):
+        """Return the first and last (row, col) of the named winning line."""
+        return self.geometry.endpoints[win_type]
     
     def get_board_state(self):
         """Return a copy of the current board state."""
         return [row[:] for row in self.board]
     
+    def get_bitboard(self):
+        """Return a copy of the current board as a Bitboard."""
+        return self.bitboard.copy()
+    
     def is_full(self):
         """Check if the board is full."""
-        for row in self.board:
-            if '' in row:
-                return False
-        return True
+        return self.state.is_full()
     
     def check_winner(self):
         """
@@ -293,24 +406,4 @@ class GameBoard:
             - winner is the winning symbol or None
             - win_type indicates which line won (row0, col1, diag1, etc.)
         """
-        # Check rows
-        for row_idx, row in enumerate(self.board):
-            if row[0] != '' and row[0] == row[1] == row[2]:
-                return row[0], f'row{row_idx}'
-        
-        # Check columns
-        for col in range(3):
-            if (self.board[0][col] != '' and 
-                self.board[0][col] == self.board[1][col] == self.board[2][col]):
-                return self.board[0][col], f'col{col}'
-        
-        # Check diagonals
-        if (self.board[0][0] != '' and 
-            self.board[0][0] == self.board[1][1] == self.board[2][2]):
-            return self.board[0][0], 'diag1'
-        
-        if (self.board[0][2] != '' and 
-            self.board[0][2] == self.board[1][1] == self.board[2][0]):
-            return self.board[0][2], 'diag2'
-        
-        return None, None
\ No newline at end of file
+        return self.state.winner, self.state.win_type
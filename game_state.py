@@ -0,0 +1,67 @@
+"""
+Rules state of a game in progress, without any drawing.
+
+GameState keeps a running count of each player's pieces on every winning
+line, so a move is judged by updating the counters of the lines through
+its cell instead of rescanning the board. It has no pygame dependency,
+so headless simulators can use it directly.
+"""
+from collections import namedtuple
+
+from bitboard import Bitboard, CLASSIC
+
+
+class MoveResult(namedtuple('MoveResult', ['winner', 'win_type', 'is_draw'])):
+    """
+    Outcome of a move:
+        - winner is the winning symbol or None
+        - win_type names the completed line (row0, col1, diag1, etc.) or None
+        - is_draw is True when the move filled the board without a winner
+    """
+    __slots__ = ()
+
+    @property
+    def game_over(self):
+        """Check if the move ended the game."""
+        return self.winner is not None or self.is_draw
+
+
+class GameState:
+    def __init__(self, geometry=CLASSIC):
+        self.geometry = geometry
+        self.reset()
+
+    def reset(self):
+        """Clear the board and every line counter."""
+        line_count = len(self.geometry.line_masks)
+        self.bitboard = Bitboard(geometry=self.geometry)
+        self.line_counts = {'X': [0] * line_count, 'O': [0] * line_count}
+        self.moves_made = 0
+        self.winner = None
+        self.win_type = None
+
+    def place(self, row, col, symbol):
+        """
+        Put a symbol on an empty cell and judge the move.
+        Returns a MoveResult, or None if the cell is outside the board or taken.
+        """
+        geometry = self.geometry
+        if not (0 <= row < geometry.size and 0 <= col < geometry.size):
+            return None
+        if not self.bitboard.place(row, col, symbol):
+            return None
+        self.moves_made += 1
+
+        # Only the lines through this cell change
+        counts = self.line_counts[symbol]
+        for idx in geometry.lines_through[row * geometry.size + col]:
+            counts[idx] += 1
+            if counts[idx] == geometry.win_length and self.winner is None:
+                self.winner = symbol
+                self.win_type = geometry.win_types[idx]
+
+        return MoveResult(self.winner, self.win_type, self.winner is None and self.is_full())
+
+    def is_full(self):
+        """Check if the board is full."""
+        return self.moves_made == self.geometry.cell_count
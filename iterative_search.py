@@ -0,0 +1,203 @@
+"""
+Time-bounded search for N x N boards with K in a row.
+
+Exhaustive search stops being possible beyond 3x3, so this engine runs
+negamax with alpha-beta to increasing depths until its time budget runs
+out and plays the best move of the deepest completed iteration. Only the
+lines through the last move are checked for a win, leaves are scored by
+counting open lines, and only cells next to existing pieces are searched.
+Deepening stops early once an iteration is proven: every line it searched
+ended in a win or a full board, and no cell was left out.
+"""
+import time
+
+from bitboard import iter_bits
+from negamax import EXACT, LOWER, UPPER
+
+WIN_SCORE = 1000000
+INFINITY = 2 * WIN_SCORE
+
+# How often (in nodes) the deadline and stop callback are checked
+CHECK_INTERVAL = 256
+
+# Entries kept before the transposition table is cleared
+MAX_TABLE_SIZE = 500000
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget is used up."""
+
+
+class IterativeDeepeningEngine:
+    """
+    Scores are from the point of view of the player to move. A win is
+    worth WIN_SCORE plus the remaining depth, so faster wins and slower
+    losses are preferred.
+    """
+    def __init__(self, geometry, max_branching=12):
+        self.geometry = geometry
+        # Inner nodes only search this many of their most promising cells
+        self.max_branching = max_branching
+        self.table = {}  # {(me, opp): (depth, flag, value, best cell, proven)}
+        self.nodes = 0
+        self.completed_depth = 0
+        # Value of a line holding n of one player's pieces and none of the other's
+        self.line_weights = tuple(0 if n == 0 else 4 ** n for n in range(geometry.win_length + 1))
+        self._deadline = 0
+        self._should_stop = None
+        self._proven = True  # Cleared when the current subtree's value is heuristic
+
+    def best_move(self, board, time_budget=1.0, should_stop=None):
+        """
+        Search a Bitboard until time_budget seconds have passed (or
+        should_stop() returns True) and return the best (row, col) found,
+        or None if the board is full.
+        """
+        geometry = self.geometry
+        me, opp = board.sides()
+        moves = self._ordered_moves(me, opp)
+        if not moves:
+            return None
+
+        self.nodes = 0
+        self.completed_depth = 0
+        # A forced move (such as the center on an empty board) needs no search
+        if len(moves) == 1:
+            return geometry.cell_coords[moves[0]]
+        self._deadline = time.monotonic() + time_budget
+        self._should_stop = should_stop
+        if len(self.table) > MAX_TABLE_SIZE:
+            self.table.clear()
+
+        best = moves[0]
+        empty_count = geometry.cell_count - (me | opp).bit_count()
+        for depth in range(1, empty_count + 1):
+            # Root moves leaving out empty cells can't prove anything
+            self._proven = len(moves) == empty_count
+            try:
+                score, best = self._search_root(me, opp, depth, moves)
+            except SearchTimeout:
+                break
+            self.completed_depth = depth
+            # Search the previous best move first on the next iteration
+            moves = [best] + [cell for cell in moves if cell != best]
+            if abs(score) >= WIN_SCORE or self._proven:
+                break
+        return geometry.cell_coords[best]
+
+    def _search_root(self, me, opp, depth, moves):
+        """Search every root move to the given depth; return (score, cell)."""
+        alpha = -INFINITY
+        best_cell = moves[0]
+        for cell in moves:
+            score = -self._negamax(opp, me | self.geometry.cell_bits[cell],
+                                   depth - 1, -INFINITY, -alpha, cell)
+            if score > alpha:
+                alpha = score
+                best_cell = cell
+        return alpha, best_cell
+
+    def _negamax(self, me, opp, depth, alpha, beta, last_cell):
+        """Score the position for `me`, the player to move, to the given depth."""
+        geometry = self.geometry
+        self.nodes += 1
+        if self.nodes % CHECK_INTERVAL == 0:
+            if time.monotonic() >= self._deadline or (self._should_stop and self._should_stop()):
+                raise SearchTimeout()
+
+        # Only lines through the opponent's last move can have been completed
+        if geometry.winning_line_at(opp, last_cell) >= 0:
+            return -(WIN_SCORE + depth)
+        if me | opp == geometry.full_mask:
+            return 0
+        if depth == 0:
+            self._proven = False
+            return self._evaluate(me, opp)
+
+        key = (me, opp)
+        entry = self.table.get(key)
+        hash_move = -1
+        original_alpha = alpha
+        # Track whether this subtree alone is proven, then fold it into the parent's
+        parent_proven = self._proven
+        self._proven = True
+        if entry is not None:
+            entry_depth, flag, value, hash_move, proven = entry
+            if entry_depth >= depth:
+                self._proven = proven
+                if flag == EXACT:
+                    self._proven &= parent_proven
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    self._proven &= parent_proven
+                    return value
+
+        moves = self._ordered_moves(me, opp)
+        # Leaving out empty cells, near or far, makes the value heuristic
+        if len(moves) < geometry.cell_count - (me | opp).bit_count():
+            self._proven = False
+        if len(moves) > self.max_branching:
+            moves = moves[:self.max_branching]
+            self._proven = False
+        if hash_move >= 0:
+            moves = [hash_move] + [cell for cell in moves if cell != hash_move]
+
+        best = -INFINITY
+        best_cell = -1
+        for cell in moves:
+            score = -self._negamax(opp, me | geometry.cell_bits[cell], depth - 1, -beta, -alpha, cell)
+            if score > best:
+                best = score
+                best_cell = cell
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best <= original_alpha:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table[key] = (depth, flag, best, best_cell, self._proven)
+        self._proven &= parent_proven
+        return best
+
+    def _ordered_moves(self, me, opp):
+        """Return the empty cells next to existing pieces, most promising first."""
+        geometry = self.geometry
+        weights = self.line_weights
+        line_masks = geometry.line_masks
+        scored = []
+        for cell in iter_bits(geometry.candidates(me | opp)):
+            # Cells that extend our lines or block the opponent's come first
+            priority = 0
+            for idx in geometry.lines_through[cell]:
+                mask = line_masks[idx]
+                mine = me & mask
+                theirs = opp & mask
+                if not theirs:
+                    priority += weights[mine.bit_count()]
+                if not mine:
+                    priority += weights[theirs.bit_count()]
+            scored.append((priority, cell))
+        scored.sort(reverse=True)
+        return [cell for _, cell in scored]
+
+    def _evaluate(self, me, opp):
+        """Score a quiet position by the lines each player can still complete."""
+        weights = self.line_weights
+        score = 0
+        for mask in self.geometry.line_masks:
+            mine = me & mask
+            theirs = opp & mask
+            if mine and not theirs:
+                score += weights[mine.bit_count()]
+            elif theirs and not mine:
+                score -= weights[theirs.bit_count()]
+        return score
@@ -0,0 +1,166 @@
+"""
+Precomputed best moves for every legal tic-tac-toe position.
+
+The table is built once by solving all 5,478 reachable positions with the
+negamax engine and written to a small binary file that is memory-mapped
+at startup, so a hard-mode move is a single indexed read.
+
+File format (all integers little-endian):
+    header:  magic b'TTTL', version u16, entry size u16,
+             entry count u32, reserved u32            (16 bytes)
+    entries: one u16 per base-3 position index, where cell i contributes
+             3**i * (0 empty, 1 X, 2 O):
+                 bits 0-8   mask of every optimal move (cell bit indices)
+                 bits 9-10  outcome for the player to move (see below)
+
+Rebuild the table with:
+    python lookup_table.py [path]
+"""
+import mmap
+import os
+import struct
+import sys
+
+from bitboard import Bitboard, BOARD_CELLS, CELL_BITS, CELL_COORDS, FULL_MASK, SET_CELLS, WIN_LINE
+from negamax import NegamaxEngine, side_to_move
+
+MAGIC = b'TTTL'
+VERSION = 1
+HEADER = struct.Struct('<4sHHII')
+ENTRY = struct.Struct('<H')
+ENTRY_COUNT = 3 ** BOARD_CELLS
+
+# Outcomes for the player to move
+OUTCOME_UNREACHABLE = 0
+OUTCOME_WIN = 1
+OUTCOME_DRAW = 2
+OUTCOME_LOSS = 3
+
+OUTCOME_SHIFT = 9
+MOVES_MASK = FULL_MASK
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'tictactoe.lut')
+
+# Base-3 index contributions of each player's bits
+X_INDEX = tuple(sum(3 ** i for i in SET_CELLS[bits]) for bits in range(FULL_MASK + 1))
+O_INDEX = tuple(2 * index for index in X_INDEX)
+
+
+def position_index(board):
+    """Return the base-3 index of a Bitboard."""
+    return X_INDEX[board.x] + O_INDEX[board.o]
+
+
+def reachable_positions():
+    """Return every position reachable in legal play, including finished games."""
+    seen = set()
+    stack = [(0, 0)]
+    while stack:
+        x, o = stack.pop()
+        if (x, o) in seen:
+            continue
+        seen.add((x, o))
+        if WIN_LINE[x] >= 0 or WIN_LINE[o] >= 0:
+            continue
+        x_to_move = len(SET_CELLS[x]) == len(SET_CELLS[o])
+        for cell in SET_CELLS[FULL_MASK & ~(x | o)]:
+            if x_to_move:
+                stack.append((x | CELL_BITS[cell], o))
+            else:
+                stack.append((x, o | CELL_BITS[cell]))
+    return seen
+
+
+def build(path=DEFAULT_PATH, engine=None):
+    """Solve every reachable position and write the table to path."""
+    engine = engine or NegamaxEngine()
+    entries = bytearray(ENTRY_COUNT * ENTRY.size)
+    for x, o in reachable_positions():
+        board = Bitboard(x, o)
+        me, opp = side_to_move(board)
+        moves = 0
+        if WIN_LINE[opp] >= 0:
+            outcome = OUTCOME_LOSS
+        elif board.is_full():
+            outcome = OUTCOME_DRAW
+        else:
+            score, best = engine.best_moves(board)
+            for row, col in best:
+                moves |= CELL_BITS[row * 3 + col]
+            if score > 0:
+                outcome = OUTCOME_WIN
+            elif score < 0:
+                outcome = OUTCOME_LOSS
+            else:
+                outcome = OUTCOME_DRAW
+        ENTRY.pack_into(entries, position_index(board) * ENTRY.size,
+                        moves | outcome << OUTCOME_SHIFT)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Write to a temporary file first so a reader never maps a partial table
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, ENTRY.size, ENTRY_COUNT, 0))
+        f.write(entries)
+    os.replace(tmp_path, path)
+
+
+class LookupTable:
+    """Read-only view of a table file built by build()."""
+    def __init__(self, path=DEFAULT_PATH):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self._map.close()
+            raise ValueError(f"{path} is too small to be a lookup table")
+        magic, version, entry_size, count, _ = HEADER.unpack_from(self._map, 0)
+        if (magic != MAGIC or version != VERSION or entry_size != ENTRY.size or
+                count != ENTRY_COUNT or len(self._map) != HEADER.size + count * entry_size):
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} lookup table")
+
+    def close(self):
+        """Unmap the table file."""
+        self._map.close()
+
+    def _entry(self, board):
+        offset = HEADER.size + position_index(board) * 2
+        return self._map[offset] | self._map[offset + 1] << 8
+
+    def as_array(self):
+        """Return the entries as a read-only NumPy uint16 view of the mapping."""
+        import numpy as np
+        return np.frombuffer(self._map, dtype='<u2', count=ENTRY_COUNT, offset=HEADER.size)
+
+    def outcome(self, board):
+        """Return the OUTCOME_* value of a Bitboard for the player to move."""
+        return self._entry(board) >> OUTCOME_SHIFT
+
+    def best_moves(self, board):
+        """Return every optimal (row, col) for a Bitboard."""
+        return [CELL_COORDS[cell] for cell in SET_CELLS[self._entry(board) & MOVES_MASK]]
+
+
+def load(path=DEFAULT_PATH):
+    """
+    Map the table at path, building it first if it is missing or stale.
+    Returns None if the table can't be built (e.g. read-only install), in
+    which case callers should fall back to searching.
+    """
+    try:
+        return LookupTable(path)
+    except (OSError, ValueError):
+        pass
+    try:
+        build(path)
+        return LookupTable(path)
+    except (OSError, ValueError):
+        return None
+
+
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    build(output)
+    print(f"Wrote {ENTRY_COUNT} entries ({len(reachable_positions())} reachable) to {output}")
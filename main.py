@@ -1,3 +1,4 @@
+import argparse
 import pygame
 import sys
 import random
@@ -6,8 +7,30 @@ from game_board import GameBoard
 from ai_player import AIPlayer
 from animation_effects import AnimationEffects
 from button_effects import ButtonEffects
+from render_pipeline import RenderPipeline
+from sprite_cache import shared_cache
+from starfield import Starfield
+from particle_system import ParticlePool
+from frame_profiler import FrameProfiler
+from quality_governor import QualityGovernor
 
-def main():
+def main(profile_path=None, show_profiler=False, frame_hook=None, max_fps=60, governor=None):
+    """
+    Run the game. Frame timings are always collected; F3 toggles the
+    overlay, and profile_path streams every frame to a CSV or JSON lines
+    file (see FrameProfiler).
+    
+    The game simulates at a fixed TICK_RATE whatever the frame rate (capped
+    at max_fps): each frame runs however many ticks the elapsed time calls
+    for, then draws alpha of the way between the last two ticks.
+    
+    governor scales effects down when frames run over budget and back up
+    when there is headroom; by default a QualityGovernor targeting max_fps.
+    
+    frame_hook, if given, is called with each frame's profiler sample once
+    the frame is presented. Events it posts are handled next frame, which
+    lets scripts drive the game (see benchmarks/bench_scenes.py).
+    """
     # Initialize pygame
     pygame.init()
     
@@ -15,6 +38,14 @@ def main():
     SCREEN_WIDTH = 700
     SCREEN_HEIGHT = 800
     BOARD_SIZE = 500
+    STAR_COUNT = 200
+    
+    # Fixed simulation step. Animation speeds are per tick, tuned at 60
+    TICK_RATE = 60
+    TICK_MS = 1000 / TICK_RATE
+    # Ticks one frame may catch up on; after a longer stall the game slows
+    # down rather than spending the next frames simulating
+    MAX_TICKS_PER_FRAME = 8
     
     # Colors
     WHITE = (255, 255, 255)
@@ -38,13 +69,40 @@ def main():
         medium_font = pygame.font.SysFont('cursive', 36)
         small_font = pygame.font.SysFont('cursive', 28)
     
+    # Text never changes between frames, so labels are rendered once
+    sprites = shared_cache()
+    
     # Create the screen
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Tic Tac Toe")
     
+    # Only the regions that change are presented each frame
+    render_pipeline = RenderPipeline((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    # Frame timing and allocation statistics
+    profiler = FrameProfiler(names=(
+        'events', 'ai', 'stars.update', 'stars.draw', 'particles.update', 'board.draw',
+        'buttons.draw', 'present', 'surfaces.board', 'surfaces.effects', 'surfaces.buttons',
+        'quality.changes'
+    ))
+    profiler.overlay_visible = show_profiler
+    if profile_path:
+        profiler.export(profile_path)
+    profiler_font = pygame.font.Font(None, 20)
+    last_scene_state = None
+    
+    # Board variants: (label, cells per side, pieces in a row to win)
+    BOARD_OPTIONS = [
+        ("3x3", 3, 3),
+        ("4x4", 4, 4),
+        ("5x5", 5, 4),
+        ("15x15", 15, 5),
+    ]
+    
     # Create game board
     board_x = (SCREEN_WIDTH - BOARD_SIZE) // 2
     board_y = (SCREEN_HEIGHT - BOARD_SIZE) // 2
+    board_option = 0
     game_board = GameBoard(board_x, board_y, BOARD_SIZE)
     
     # Create animation effects
@@ -62,6 +120,7 @@ def main():
     win_type = None
     show_menu = True
     start_game = False
+    pending_move = None  # Background AI search, if one is running
     
     # Button states
     restart_button_active = False
@@ -102,43 +161,80 @@ def main():
         button_height
     )
     
+    # Board size buttons
+    size_button_width = 120
+    size_buttons = []
+    for i in range(len(BOARD_OPTIONS)):
+        size_buttons.append(pygame.Rect(
+            (SCREEN_WIDTH - len(BOARD_OPTIONS) * (size_button_width + button_spacing) + button_spacing) // 2
+            + i * (size_button_width + button_spacing),
+            390,
+            size_button_width,
+            button_height
+        ))
+    
     # Menu particles
-    menu_particles = []
+    menu_particles = ParticlePool(256)
+    menu_particle_colors = [
+        DIFFICULTY_EASY_COLOR, 
+        DIFFICULTY_MEDIUM_COLOR, 
+        DIFFICULTY_HARD_COLOR, 
+        BUTTON_COLOR
+    ]
     
     # Background stars
-    stars = []
-    for _ in range(200):  # Increased from 100 to 200
-        stars.append({
-            'x': random.randint(0, SCREEN_WIDTH),
-            'y': random.randint(0, SCREEN_HEIGHT),
-            'size': random.randint(1, 4),
-            'speed': random.uniform(0.1, 0.8),
-            'twinkle': random.random(),
-            'color': (
-                random.randint(180, 255),
-                random.randint(180, 255),
-                random.randint(200, 255)
-            )
-        })
+    starfield = Starfield(SCREEN_WIDTH, SCREEN_HEIGHT, STAR_COUNT)
     
     # Game loop
     clock = pygame.time.Clock()
     
     # Transition animation
     transition_alpha = 255
+    previous_transition_alpha = transition_alpha  # Before the last tick, for interpolation
     fading_out = False
     fade_speed = 5
     
+    # Effect quality, following the measured frame times
+    if governor is None:
+        governor = QualityGovernor(target_fps=max_fps)
+    full_trail_length = animation.particles.trail_length
+    
+    def apply_quality():
+        animation.celebration_particle_count = governor.scale(20, 100)
+        animation.particles.visible_trail_length = governor.scale(2, full_trail_length)
+        button_effects.glow_layer_spacing = governor.scale(8, 2)
+        starfield.visible_count = governor.scale(50, STAR_COUNT)
+        # Stars that stop being drawn must be erased everywhere
+        render_pipeline.request_full_redraw()
+    
+    apply_quality()
+    
+    # Milliseconds of real time not yet simulated
+    accumulator = 0.0
+    frame_ms = TICK_MS
+    
+    # Pointer position, following mouse events
+    mouse_pos = pygame.mouse.get_pos()
+    
     while True:
+        profiler.begin_frame()
+        
         # Handle events
+        profiler.start('events')
         for event in pygame.event.get():
+            if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                mouse_pos = event.pos
+            
             if event.type == pygame.QUIT:
+                profiler.close()
                 pygame.quit()
                 sys.exit()
             
+            if event.type == pygame.VIDEOEXPOSE:
+                # The window contents were lost, so present everything
+                render_pipeline.request_full_redraw()
+            
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mouse_pos = pygame.mouse.get_pos()
-                
                 if show_menu:
                     # Difficulty buttons
                     if easy_button.collidepoint(mouse_pos):
@@ -163,6 +259,13 @@ def main():
                         medium_button_active = False
                         hard_button_active = True
                     
+                    # Board size buttons
+                    for i, size_button in enumerate(size_buttons):
+                        if size_button.collidepoint(mouse_pos) and i != board_option:
+                            board_option = i
+                            _, grid_size, win_length = BOARD_OPTIONS[i]
+                            game_board = GameBoard(board_x, board_y, BOARD_SIZE, grid_size, win_length)
+                    
                     # Start button
                     if start_button.collidepoint(mouse_pos):
                         start_button_active = True
@@ -171,11 +274,12 @@ def main():
                 elif not fading_out:
                     # Game board clicking (only when it's player's turn and game is not over)
                     if not game_over and player_turn:
-                        if game_board.make_move(mouse_pos, 'X'):
+                        result = game_board.make_move(mouse_pos, 'X')
+                        if result:
                             player_turn = False
                             
                             # Check for win or draw
-                            winner, win_type = game_board.check_winner()
+                            winner, win_type = result.winner, result.win_type
                             if winner:
                                 game_over = True
                                 # Start win animation if we have win type
@@ -184,9 +288,10 @@ def main():
                                         win_type, 
                                         game_board.cell_size, 
                                         game_board.x, 
-                                        game_board.y
+                                        game_board.y,
+                                        game_board.get_win_endpoints(win_type)
                                     )
-                            elif game_board.is_full():
+                            elif result.is_draw:
                                 game_over = True
                     
                     # Check for button clicks during gameplay
@@ -206,6 +311,9 @@ def main():
                     
                     if restart_button.collidepoint(mouse_pos):
                         restart_button_active = True
+                        if pending_move:
+                            pending_move.cancel()
+                            pending_move = None
                         game_board.reset()
                         animation.reset()
                         game_over = False
@@ -215,6 +323,9 @@ def main():
                     elif menu_button.collidepoint(mouse_pos):
                         menu_button_active = True
                         fading_out = True
+                        if pending_move:
+                            pending_move.cancel()
+                            pending_move = None
             
             if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
                 # Reset active states for buttons
@@ -225,6 +336,9 @@ def main():
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r and not show_menu:
                     # Reset the game
+                    if pending_move:
+                        pending_move.cancel()
+                        pending_move = None
                     game_board.reset()
                     animation.reset()
                     game_over = False
@@ -234,58 +348,99 @@ def main():
                 elif event.key == pygame.K_m and not fading_out:
                     # Return to menu
                     fading_out = True
+                    if pending_move:
+                        pending_move.cancel()
+                        pending_move = None
                     # Will go back to menu after fade out
+                elif event.key == pygame.K_F3:
+                    profiler.overlay_visible = not profiler.overlay_visible
+                    render_pipeline.request_full_redraw()
+        profiler.stop('events')
         
-        # Update stars with color cycling
-        for star in stars:
-            star['y'] += star['speed']
-            if star['y'] > SCREEN_HEIGHT:
-                star['y'] = 0
-                star['x'] = random.randint(0, SCREEN_WIDTH)
-            star['twinkle'] = (star['twinkle'] + 0.02) % 1.0  # Faster twinkling
+        # Advance the simulation in fixed ticks to catch up with real time
+        accumulator += min(frame_ms, MAX_TICKS_PER_FRAME * TICK_MS)
+        while accumulator >= TICK_MS:
+            accumulator -= TICK_MS
             
-            # Cycle through colors
-            r, g, b = star['color']
-            star['color'] = (
-                180 + int(75 * abs(math.sin(star['twinkle'] * math.pi))),
-                180 + int(75 * abs(math.sin(star['twinkle'] * math.pi + 2))),
-                200 + int(55 * abs(math.sin(star['twinkle'] * math.pi + 4)))
-            )
-        
-        # Handle transition animation
-        if fading_out:
-            transition_alpha += fade_speed
-            if transition_alpha >= 255:
-                transition_alpha = 255
-                fading_out = False
-                if show_menu:
-                    show_menu = False
-                    start_game = True
-                    # Reset the game
-                    game_board.reset()
-                    animation.reset()
-                    game_over = False
-                    player_turn = True
-                    winner = None
-                    win_type = None
-                else:
-                    show_menu = True
-        elif transition_alpha > 0:
-            transition_alpha -= fade_speed
-            if transition_alpha < 0:
-                transition_alpha = 0
+            # Update stars with color cycling
+            profiler.start('stars.update')
+            starfield.update()
+            profiler.stop('stars.update')
+            
+            # Handle transition animation
+            previous_transition_alpha = transition_alpha
+            if fading_out:
+                transition_alpha += fade_speed
+                if transition_alpha >= 255:
+                    transition_alpha = 255
+                    fading_out = False
+                    if show_menu:
+                        show_menu = False
+                        start_game = True
+                        # Reset the game
+                        game_board.reset()
+                        animation.reset()
+                        game_over = False
+                        player_turn = True
+                        winner = None
+                        win_type = None
+                    else:
+                        show_menu = True
+            elif transition_alpha > 0:
+                transition_alpha -= fade_speed
+                if transition_alpha < 0:
+                    transition_alpha = 0
+            
+            # Update animations
+            profiler.start('particles.update')
+            game_board.update()
+            animation.update_animations()
+            button_effects.update()
+            
+            # Menu particle effects
+            if show_menu and random.random() < 0.1:
+                particle = menu_particles.acquire()
+                if particle is not None:
+                    particle.x = random.randint(0, SCREEN_WIDTH)
+                    particle.y = random.randint(0, SCREEN_HEIGHT)
+                    particle.size = random.randint(2, 5)
+                    particle.color = random.choice(menu_particle_colors)
+                    speed = random.uniform(0.5, 2.0)
+                    angle = random.uniform(0, math.pi * 2)
+                    particle.vel_x = math.cos(angle) * speed
+                    particle.vel_y = math.sin(angle) * speed
+            
+            # Update menu particles
+            for particle in menu_particles:
+                particle.x += particle.vel_x
+                particle.y += particle.vel_y
+                particle.size -= 0.02
+                
+                if particle.size <= 0 or (
+                    particle.x < 0 or particle.x > SCREEN_WIDTH or
+                    particle.y < 0 or particle.y > SCREEN_HEIGHT
+                ):
+                    menu_particles.release(particle)
+            profiler.stop('particles.update')
         
         # AI's turn (only when game is active)
+        profiler.start('ai')
         if not show_menu and not game_over and not player_turn and transition_alpha == 0:
+            # Start the search in the background, then poll it each frame
+            if pending_move is None:
+                pending_move = ai_player.request_move(game_board.get_bitboard())
+        
+        if pending_move is not None and pending_move.done():
             # AI makes a move
-            ai_move = ai_player.make_move(game_board.get_board_state())
+            ai_move = pending_move.result()
+            pending_move = None
             if ai_move is not None:
                 row, col = ai_move
-                game_board.set_cell(row, col, 'O')
+                result = game_board.set_cell(row, col, 'O')
                 player_turn = True
                 
                 # Check for win or draw
-                winner, win_type = game_board.check_winner()
+                winner, win_type = result.winner, result.win_type
                 if winner:
                     game_over = True
                     # Start win animation if we have win type
@@ -294,66 +449,48 @@ def main():
                             win_type, 
                             game_board.cell_size, 
                             game_board.x, 
-                            game_board.y
+                            game_board.y,
+                            game_board.get_win_endpoints(win_type)
                         )
-                elif game_board.is_full():
+                elif result.is_draw:
                     game_over = True
+        profiler.stop('ai')
         
-        # Update animations
-        animation.update_animations()
-        button_effects.update()
+        # How far this frame falls between the last tick and the next
+        alpha = accumulator / TICK_MS
+        fade_alpha = int(previous_transition_alpha + (transition_alpha - previous_transition_alpha) * alpha)
+        button_effects.begin_frame(alpha)
         
-        # Menu particle effects
-        if show_menu and random.random() < 0.1:
-            menu_particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'size': random.randint(2, 5),
-                'color': random.choice([
-                    DIFFICULTY_EASY_COLOR, 
-                    DIFFICULTY_MEDIUM_COLOR, 
-                    DIFFICULTY_HARD_COLOR, 
-                    BUTTON_COLOR
-                ]),
-                'speed': random.uniform(0.5, 2.0),
-                'angle': random.uniform(0, math.pi * 2)
-            })
-        
-        # Update menu particles
-        for particle in menu_particles[:]:
-            particle['x'] += math.cos(particle['angle']) * particle['speed']
-            particle['y'] += math.sin(particle['angle']) * particle['speed']
-            particle['size'] -= 0.02
-            
-            if particle['size'] <= 0 or (
-                particle['x'] < 0 or particle['x'] > SCREEN_WIDTH or
-                particle['y'] < 0 or particle['y'] > SCREEN_HEIGHT
-            ):
-                menu_particles.remove(particle)
+        # Anything that changes text, buttons or board contents redraws the
+        # whole screen; in between only animated regions are presented
+        scene_state = (
+            show_menu, ai_difficulty, board_option, game_over, player_turn, winner,
+            game_board.state.moves_made, restart_button_active, menu_button_active,
+            start_button_active, easy_button_active, medium_button_active, hard_button_active
+        )
+        if scene_state != last_scene_state or transition_alpha > 0 or fade_alpha > 0:
+            render_pipeline.request_full_redraw()
+            last_scene_state = scene_state
         
         # Drawing
         screen.fill(BACKGROUND_COLOR)
         
         # Draw stars with new colors
-        for star in stars:
-            brightness = abs(math.sin(star['twinkle'] * math.pi * 2))
-            color = tuple(int(c * brightness) for c in star['color'])
-            pygame.draw.circle(
-                screen, 
-                color, 
-                (int(star['x']), int(star['y'])), 
-                star['size']
-            )
-        
-        # Get mouse position for button hover effects
-        mouse_pos = pygame.mouse.get_pos()
+        profiler.start('stars.draw')
+        starfield.draw(screen, alpha)
+        if len(starfield) > render_pipeline.max_rects:
+            # Too many to present one by one; the whole screen is changing
+            render_pipeline.request_full_redraw()
+        else:
+            render_pipeline.mark_all(starfield.dirty_rects())
+        profiler.stop('stars.draw')
         
         # Draw menu
         if show_menu:
             # Draw title with shadow
-            title_text = font.render("Tic Tac Toe", True, TEXT_COLOR)
+            title_text = sprites.text(font, "Tic Tac Toe", True, TEXT_COLOR)
             shadow_offset = 3
-            title_shadow = font.render("Tic Tac Toe", True, (200, 200, 200))
+            title_shadow = sprites.text(font, "Tic Tac Toe", True, (200, 200, 200))
             screen.blit(title_shadow, (
                 SCREEN_WIDTH // 2 - title_text.get_width() // 2 + shadow_offset, 
                 150 + shadow_offset
@@ -361,12 +498,31 @@ def main():
             screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 150))
             
             # Draw subtitle
-            subtitle_text = medium_font.render("Select AI Difficulty", True, TEXT_COLOR)
+            subtitle_text = sprites.text(medium_font, "Select AI Difficulty", True, TEXT_COLOR)
             screen.blit(subtitle_text, (
                 SCREEN_WIDTH // 2 - subtitle_text.get_width() // 2, 
                 220
             ))
             
+            # Draw board size label and buttons
+            size_text = sprites.text(medium_font, "Board Size", True, TEXT_COLOR)
+            screen.blit(size_text, (
+                SCREEN_WIDTH // 2 - size_text.get_width() // 2, 
+                320
+            ))
+            profiler.start('buttons.draw')
+            for i, size_button in enumerate(size_buttons):
+                button_effects.draw_button(
+                    surface=screen,
+                    rect=size_button,
+                    color=BUTTON_COLOR,
+                    text=BOARD_OPTIONS[i][0],
+                    text_color=BUTTON_TEXT_COLOR,
+                    font=small_font,
+                    is_hovered=size_button.collidepoint(mouse_pos),
+                    is_selected=board_option == i
+                )
+            
             # Draw Easy button with effects
             button_effects.draw_button(
                 surface=screen,
@@ -417,21 +573,21 @@ def main():
                 is_hovered=start_button.collidepoint(mouse_pos),
                 is_active=start_button_active
             )
+            profiler.stop('buttons.draw')
             
-            # Draw menu particles
+            # Draw menu particles, stepped back to where they are between ticks
             for particle in menu_particles:
-                pygame.draw.circle(
-                    screen, 
-                    particle['color'], 
-                    (int(particle['x']), int(particle['y'])), 
-                    int(particle['size'])
-                )
+                x = int(particle.x - particle.vel_x * (1 - alpha))
+                y = int(particle.y - particle.vel_y * (1 - alpha))
+                pygame.draw.circle(screen, particle.color, (x, y), int(particle.size))
+                size = int(particle.size) + 1
+                render_pipeline.mark((x - size, y - size, size * 2 + 1, size * 2 + 1))
         else:
             # Draw game screen
             # Title with shadow
-            title_text = font.render("Tic Tac Toe", True, TEXT_COLOR)
+            title_text = sprites.text(font, "Tic Tac Toe", True, TEXT_COLOR)
             shadow_offset = 2
-            title_shadow = font.render("Tic Tac Toe", True, (200, 200, 200))
+            title_shadow = sprites.text(font, "Tic Tac Toe", True, (200, 200, 200))
             screen.blit(title_shadow, (
                 SCREEN_WIDTH // 2 - title_text.get_width() // 2 + shadow_offset, 
                 50 + shadow_offset
@@ -450,15 +606,20 @@ def main():
                 difficulty_color = DIFFICULTY_HARD_COLOR
                 difficulty_text = "Hard AI"
             
-            diff_text = small_font.render(difficulty_text, True, difficulty_color)
+            if game_board.grid_size != 3:
+                difficulty_text += f" - {game_board.win_length} in a row"
+            
+            diff_text = sprites.text(small_font, difficulty_text, True, difficulty_color)
             diff_rect = diff_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
             screen.blit(diff_text, diff_rect)
             
             # Draw game board
-            game_board.draw(screen, animation)
+            profiler.start('board.draw')
+            game_board.draw(screen, animation, mouse_pos, alpha)
             
             # Draw animations
-            animation.draw_animations(screen)
+            animation.draw_animations(screen, alpha)
+            profiler.stop('board.draw')
             
             # Draw status
             status_text = ""
@@ -480,7 +641,7 @@ def main():
                     status_text = "AI Thinking..."
                     status_color = (241, 90, 90)  # Red (AI color)
             
-            status_render = font.render(status_text, True, status_color)
+            status_render = sprites.text(font, status_text, True, status_color)
             screen.blit(status_render, (
                 SCREEN_WIDTH // 2 - status_render.get_width() // 2, 
                 SCREEN_HEIGHT - 150
@@ -502,6 +663,7 @@ def main():
             )
             
             # Draw restart button with effects
+            profiler.start('buttons.draw')
             button_effects.draw_button(
                 surface=screen,
                 rect=restart_button,
@@ -524,18 +686,57 @@ def main():
                 is_hovered=menu_button.collidepoint(mouse_pos),
                 is_active=menu_button_active
             )
+            profiler.stop('buttons.draw')
+        
+        # Collect the regions animated by the board and effects
+        if not show_menu:
+            render_pipeline.mark_all(game_board.dirty_rects)
+            render_pipeline.mark_all(animation.dirty_rects)
+        render_pipeline.mark_all(button_effects.dirty_rects)
         
         # Draw transition overlay
-        if transition_alpha > 0:
+        if fade_alpha > 0:
             overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, transition_alpha))
+            overlay.fill((0, 0, 0, fade_alpha))
             screen.blit(overlay, (0, 0))
         
-        # Update display
-        pygame.display.flip()
+        # Surfaces allocated by the drawing components this frame
+        profiler.count('surfaces.board', game_board.surfaces_allocated)
+        profiler.count('surfaces.effects', animation.surfaces_allocated)
+        profiler.count('surfaces.buttons', button_effects.surfaces_allocated)
+        profiler.count('quality.changes', governor.changes)
+        
+        # Profiler overlay
+        overlay_rect = profiler.draw_overlay(screen, profiler_font)
+        if overlay_rect:
+            render_pipeline.mark(overlay_rect)
+        
+        # Update display (full flip only when the scene changed)
+        profiler.start('present')
+        render_pipeline.present()
+        profiler.stop('present')
+        sample = profiler.end_frame()
+        if frame_hook:
+            frame_hook(sample)
+        
+        # Cap the frame rate; the time taken is simulated next frame
+        frame_ms = clock.tick(max_fps)
         
-        # Cap the frame rate
-        clock.tick(60)
+        # Scale the effects to the time the frame's work took
+        if governor.record(clock.get_rawtime()):
+            apply_quality()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Play tic-tac-toe against the computer.")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="write per-frame timings to PATH (.csv, otherwise JSON lines)")
+    parser.add_argument('--show-profiler', action='store_true', help="start with the F3 overlay on")
+    parser.add_argument('--fps', type=int, default=60,
+                        help="frame rate cap; the game runs at the same speed at any rate")
+    parser.add_argument('--min-quality', type=float, default=0.25,
+                        help="lowest effect quality (0-1) to drop to when frames run slow")
+    parser.add_argument('--max-quality', type=float, default=1.0,
+                        help="highest effect quality (0-1)")
+    args = parser.parse_args()
+    governor = QualityGovernor(args.fps, args.min_quality, args.max_quality)
+    main(args.profile, args.show_profiler, max_fps=args.fps, governor=governor)
\ No newline at end of file
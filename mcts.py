@@ -0,0 +1,211 @@
+"""
+Monte Carlo Tree Search for boards of any size.
+
+Each worker process grows its own UCT tree from the same root for a share
+of the playout or wall-clock budget, then returns only the visit and win
+counts of the root's children; the parent adds them up and plays the most
+visited move (root parallelization). A search that can be stopped early
+hands the workers its budget in chunks, checking between them. Wins are detected with the same
+Geometry line masks GameState uses, so the rules can't drift apart.
+"""
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bitboard import get_geometry, iter_bits
+
+# Seconds each worker searches at a time when a search can be stopped early
+CHUNK_SECONDS = 0.1
+
+
+class _Node:
+    __slots__ = ('me', 'opp', 'cell', 'parent', 'children', 'untried', 'visits', 'wins', 'terminal')
+
+    def __init__(self, me, opp, cell, parent, untried, terminal):
+        # me is the player to move here; opp just moved into this node
+        self.me = me
+        self.opp = opp
+        self.cell = cell
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0  # From the point of view of opp, who chose this node
+        self.terminal = terminal
+
+
+def _rollout(geometry, me, opp, rng):
+    """
+    Play random moves to the end of the game.
+    Returns 1 if `me` (the player to move) wins, 0 if they lose, 0.5 for a draw.
+    """
+    empty = list(iter_bits(geometry.full_mask & ~(me | opp)))
+    rng.shuffle(empty)
+    to_move_is_me = True
+    for cell in empty:
+        bit = geometry.cell_bits[cell]
+        if to_move_is_me:
+            me |= bit
+            if geometry.winning_line_at(me, cell) >= 0:
+                return 1.0
+        else:
+            opp |= bit
+            if geometry.winning_line_at(opp, cell) >= 0:
+                return 0.0
+        to_move_is_me = not to_move_is_me
+    return 0.5
+
+
+def search_tree(size, win_length, me, opp, playouts=None, time_budget=None,
+                seed=None, exploration=1.4, should_stop=None):
+    """
+    Grow one UCT tree from the position (me to move) until the playout
+    count or time budget is spent, or should_stop() returns True. Returns
+    {cell: (visits, wins)} for the root's children. Runs in worker
+    processes, so it only takes plain values (should_stop only inline).
+    """
+    geometry = get_geometry(size, win_length)
+    rng = random.Random(seed)
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    root = _Node(me, opp, -1, None, list(iter_bits(geometry.candidates(me | opp))), False)
+    rng.shuffle(root.untried)
+
+    played = 0
+    while (playouts is None or played < playouts) and (deadline is None or time.monotonic() < deadline):
+        if should_stop is not None and should_stop():
+            break
+        played += 1
+        node = root
+
+        # Selection: follow the best UCT child while the node is fully expanded
+        while not node.untried and node.children and not node.terminal:
+            log_visits = math.log(node.visits)
+            node = max(node.children, key=lambda child: child.wins / child.visits +
+                       exploration * math.sqrt(log_visits / child.visits))
+
+        # Expansion: add one untried move
+        if node.untried and not node.terminal:
+            cell = node.untried.pop()
+            mover = node.me | geometry.cell_bits[cell]
+            won = geometry.winning_line_at(mover, cell) >= 0
+            occupied = mover | node.opp
+            full = occupied == geometry.full_mask
+            child_untried = [] if won or full else list(iter_bits(geometry.candidates(occupied)))
+            rng.shuffle(child_untried)
+            child = _Node(node.opp, mover, cell, node, child_untried, won or full)
+            node.children.append(child)
+            node = child
+
+        # Simulation, scored for the player who moved into `node`
+        if node.terminal:
+            result = 1.0 if geometry.winning_line_at(node.opp, node.cell) >= 0 else 0.5
+        else:
+            result = 1.0 - _rollout(geometry, node.me, node.opp, rng)
+
+        # Backpropagation, flipping the point of view at each level
+        while node is not None:
+            node.visits += 1
+            node.wins += result
+            result = 1.0 - result
+            node = node.parent
+
+    return {child.cell: (child.visits, child.wins) for child in root.children}
+
+
+class MCTSEngine:
+    """
+    Runs search_tree in a process pool and merges the root statistics.
+    With workers=1 the search runs in the calling thread instead.
+    """
+    def __init__(self, workers=None, exploration=1.4):
+        self.workers = workers or os.cpu_count() or 1
+        self.exploration = exploration
+        self.playouts = 0
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def close(self):
+        """Shut down the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def root_statistics(self, board, playouts=None, time_budget=None, seed=None, should_stop=None):
+        """
+        Return the merged {cell: (visits, wins)} of the root's children.
+        playouts is the total across all workers; time_budget is wall-clock
+        seconds per worker (they run in parallel). At least one is required.
+        The search ends early, with the statistics so far, once
+        should_stop() returns True.
+        """
+        if playouts is None and time_budget is None:
+            raise ValueError("MCTS needs a playout or time budget")
+        geometry = board.geometry
+        me, opp = board.sides()
+        rng = random.Random(seed)
+        args = (geometry.size, geometry.win_length, me, opp)
+
+        if self.workers == 1:
+            results = [search_tree(*args, playouts, time_budget, rng.getrandbits(32), self.exploration,
+                                   should_stop)]
+        else:
+            results = self._run_workers(args, playouts, time_budget, rng, should_stop)
+
+        merged = {}
+        for stats in results:
+            for cell, (visits, wins) in stats.items():
+                total_visits, total_wins = merged.get(cell, (0, 0.0))
+                merged[cell] = (total_visits + visits, total_wins + wins)
+        self.playouts = sum(visits for visits, _ in merged.values())
+        return merged
+
+    def _run_workers(self, args, playouts, time_budget, rng, should_stop):
+        """
+        Search in the pool and return every worker's root statistics. With
+        should_stop, the budget goes out in chunks and the search ends at
+        the first chunk boundary after should_stop() returns True.
+        """
+        pool = self._get_pool()
+        workers = self.workers
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+        remaining = playouts
+        results = []
+        while True:
+            shares = [None] * workers
+            if playouts is not None:
+                shares = [remaining // workers + (i < remaining % workers) for i in range(workers)]
+            chunk_budget = time_budget
+            if should_stop is not None:
+                chunk_budget = CHUNK_SECONDS
+                if deadline is not None:
+                    chunk_budget = min(chunk_budget, max(0.0, deadline - time.monotonic()))
+            futures = [pool.submit(search_tree, *args, share, chunk_budget,
+                                   rng.getrandbits(32), self.exploration)
+                       for share in shares]
+            chunk_results = [future.result() for future in futures]
+            results.extend(chunk_results)
+
+            if remaining is not None:
+                # Every playout visits exactly one of the root's children
+                remaining -= sum(visits for stats in chunk_results for visits, _ in stats.values())
+                if remaining <= 0:
+                    break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            if should_stop is None or should_stop():
+                break
+        return results
+
+    def best_move(self, board, playouts=None, time_budget=None, seed=None, should_stop=None):
+        """Return the most visited (row, col) across all workers, or None if the board is full."""
+        merged = self.root_statistics(board, playouts, time_budget, seed, should_stop)
+        if not merged:
+            return None
+        cell = max(merged, key=lambda c: merged[c][0])
+        return board.geometry.cell_coords[cell]
@@ -0,0 +1,133 @@
+"""
+Perfect-play search for tic-tac-toe.
+
+Negamax with alpha-beta pruning over bitboards (see bitboard.py). Results
+are kept in a transposition table that lives as long as the engine, so
+positions solved on one move or in one game are free on the next. The
+table is keyed on the symmetry-canonical position (see symmetry.py), so
+rotations and reflections of a position share one entry.
+"""
+from bitboard import CELL_BITS, CELL_COORDS, FULL_MASK, SET_CELLS, WIN_LINE
+from symmetry import canonical_key, from_canonical_cell, to_canonical_cell
+
+# Transposition table entry flags
+EXACT = 0
+LOWER = 1  # Value is a lower bound (search failed high)
+UPPER = 2  # Value is an upper bound (search failed low)
+
+# Larger than any reachable score
+INFINITY = 100
+
+# Center first, then corners, then edges
+MOVE_PREFERENCE = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+
+def _build_ordered_moves():
+    """For every mask of empty cells, the cells in MOVE_PREFERENCE order."""
+    return tuple(
+        tuple(cell for cell in MOVE_PREFERENCE if empty >> cell & 1)
+        for empty in range(FULL_MASK + 1)
+    )
+
+
+ORDERED_MOVES = _build_ordered_moves()
+
+
+def side_to_move(board):
+    """Return the bits of the player to move and of their opponent."""
+    if len(SET_CELLS[board.x]) == len(SET_CELLS[board.o]):
+        return board.x, board.o
+    return board.o, board.x
+
+
+class NegamaxEngine:
+    """
+    Scores are from the point of view of the player to move: a win is
+    worth 1 + the number of empty cells left when it happens, so faster
+    wins and slower losses are preferred. A draw is 0.
+    """
+    def __init__(self):
+        self.table = {}  # {position key: (flag, value, best cell)}
+        self.nodes = 0
+
+    def clear(self):
+        """Forget every cached position."""
+        self.table.clear()
+
+    def solve(self, board):
+        """Return the game-theoretic score of a Bitboard for the side to move."""
+        me, opp = side_to_move(board)
+        return self._negamax(me, opp, -INFINITY, INFINITY)
+
+    def best_moves(self, board):
+        """
+        Return (score, moves) where moves is every (row, col) that achieves
+        the best score, so callers can pick between equally good moves.
+        """
+        me, opp = side_to_move(board)
+        empty = FULL_MASK & ~(me | opp)
+        best_score = -INFINITY
+        best = []
+        for cell in ORDERED_MOVES[empty]:
+            score = -self._negamax(opp, me | CELL_BITS[cell], -INFINITY, INFINITY)
+            if score > best_score:
+                best_score = score
+                best = [CELL_COORDS[cell]]
+            elif score == best_score:
+                best.append(CELL_COORDS[cell])
+        return best_score, best
+
+    def _negamax(self, me, opp, alpha, beta):
+        """Score the position for `me`, the player to move."""
+        self.nodes += 1
+        empty = FULL_MASK & ~(me | opp)
+
+        # The opponent's last move may have ended the game
+        if WIN_LINE[opp] >= 0:
+            return -(len(SET_CELLS[empty]) + 1)
+        if not empty:
+            return 0
+
+        # Probe the transposition table; its best move is stored in the
+        # canonical frame and has to be mapped back onto this board
+        key, transform = canonical_key(me, opp)
+        entry = self.table.get(key)
+        hash_move = -1
+        original_alpha = alpha
+        if entry is not None:
+            flag, value, hash_move = entry
+            hash_move = from_canonical_cell(hash_move, transform)
+            if flag == EXACT:
+                return value
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        # Search the cached best move first, then the usual ordering
+        moves = ORDERED_MOVES[empty]
+        if hash_move >= 0:
+            moves = (hash_move,) + tuple(cell for cell in moves if cell != hash_move)
+
+        best = -INFINITY
+        best_cell = -1
+        for cell in moves:
+            score = -self._negamax(opp, me | CELL_BITS[cell], -beta, -alpha)
+            if score > best:
+                best = score
+                best_cell = cell
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best <= original_alpha:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table[key] = (flag, best, to_canonical_cell(best_cell, transform))
+        return best
@@ -0,0 +1,293 @@
+import math
+
+import numpy as np
+import pygame
+
+# Particle shapes; only circles have a body sprite (stars and sparks are
+# drawn as their trails alone)
+CIRCLE = 0
+STAR = 1
+SPARK = 2
+
+# Spawn ranges for particle radius
+MIN_SIZE = 4
+MAX_SIZE = 12
+
+# Trail alpha is rounded to one of this many levels so trail sprites can be
+# rendered once up front
+ALPHA_BUCKETS = 16
+
+
+class ParticleSystem:
+    """
+    Celebration particles stored as a structure of arrays.
+
+    Positions, velocities, lifetimes, sizes and colors live in
+    preallocated NumPy arrays sized for `capacity` particles. Live
+    particles are always packed at the front, so each update is a handful
+    of vectorized operations and dead particles are removed with a single
+    compaction.
+
+    Trails are ring buffers that share one write cursor: every live
+    particle records a point each update, so column `_trail_head` is always
+    the next one to overwrite and nothing is shifted. Bodies and trail
+    points are drawn from sprites rendered in the constructor, so drawing
+    creates no surfaces. Past bulk_threshold particles, blitting every
+    trail point would take longer than a frame, so trails are instead
+    blended into the pixel buffer as single pixels in one scattered write,
+    keeping the newest points of each trail up to bulk_trail_points in all.
+
+    update() advances one fixed simulation tick. draw() places bodies
+    between their positions before and after the last tick; trail points
+    stay where the ticks recorded them.
+    """
+    def __init__(self, palette, capacity=20000, trail_length=10, gravity=0.1, max_lifetime=120, seed=None):
+        self.palette = list(palette)
+        self.rng = np.random.default_rng(seed)
+        self.capacity = capacity
+        self.trail_length = trail_length
+        self.visible_trail_length = trail_length  # Newest trail points drawn (see QualityGovernor)
+        self.bulk_threshold = 500  # Particles above which trails are scattered, not blitted
+        self.bulk_trail_points = 20000  # Trail pixels scattered per frame at most
+        self.gravity = gravity
+        self.max_lifetime = max_lifetime
+        self.count = 0
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.previous_x = np.zeros(capacity, dtype=np.float32)  # Before the last update()
+        self.previous_y = np.zeros(capacity, dtype=np.float32)
+        self.vel_x = np.zeros(capacity, dtype=np.float32)
+        self.vel_y = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int32)  # Index into palette
+        self.angular_vel = np.zeros(capacity, dtype=np.float32)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+
+        # Trail ring buffers; the trail_count points before _trail_head are valid
+        self._trail_head = 0
+        self.trail_x = np.zeros((capacity, trail_length), dtype=np.float32)
+        self.trail_y = np.zeros((capacity, trail_length), dtype=np.float32)
+        self.trail_alpha = np.zeros((capacity, trail_length), dtype=np.int8)  # Alpha bucket
+        self.trail_count = np.zeros(capacity, dtype=np.int32)
+
+        self._arrays = (self.x, self.y, self.previous_x, self.previous_y, self.vel_x, self.vel_y,
+                        self.lifetime, self.size, self.color, self.angular_vel, self.kind,
+                        self.trail_x, self.trail_y, self.trail_alpha, self.trail_count)
+
+        self._palette_rgb = np.array(self.palette, dtype=np.int32)
+
+        # Pre-rendered sprites, indexed by _sprite_index()
+        self._circle_sprites = [
+            self._render_circle(size, color, 255)
+            for size in range(MAX_SIZE + 1) for color in range(len(self.palette))
+        ]
+        self._trail_sprites = [
+            self._render_circle(size, color, bucket * 255 // (ALPHA_BUCKETS - 1))
+            for size in range(MAX_SIZE // 2 + 1) for color in range(len(self.palette))
+            for bucket in range(ALPHA_BUCKETS)
+        ]
+
+    def clear(self):
+        """Remove every particle."""
+        self.count = 0
+
+    def emit_burst(self, center_x, center_y, amount):
+        """
+        Spawn up to `amount` particles flying out of a point in random
+        directions. Returns the slice of the arrays holding the new ones.
+        """
+        rng = self.rng
+        amount = min(amount, self.capacity - self.count)
+        if amount <= 0:
+            return slice(self.count, self.count)
+        new = slice(self.count, self.count + amount)
+        angle = np.radians(rng.uniform(0, 360, amount))
+        speed = rng.uniform(2, 8, amount)
+        self.x[new] = self.previous_x[new] = center_x
+        self.y[new] = self.previous_y[new] = center_y
+        self.vel_x[new] = np.cos(angle) * speed
+        self.vel_y[new] = np.sin(angle) * speed
+        self.color[new] = rng.integers(0, len(self.palette), amount)
+        self.size[new] = rng.integers(MIN_SIZE, MAX_SIZE + 1, amount)
+        self.lifetime[new] = rng.integers(40, 121, amount)
+        self.angular_vel[new] = rng.uniform(-5, 5, amount)
+        self.kind[new] = rng.integers(0, 3, amount)
+        self.trail_count[new] = 0
+        self.count += amount
+        return new
+
+    def update(self):
+        """Advance every live particle one tick and drop the dead ones."""
+        n = self.count
+        if n == 0:
+            return
+        live = slice(0, n)
+
+        # Move, then apply gravity
+        self.previous_x[live] = self.x[live]
+        self.previous_y[live] = self.y[live]
+        self.x[live] += self.vel_x[live]
+        self.y[live] += self.vel_y[live]
+        self.vel_y[live] += self.gravity
+        self.lifetime[live] -= 1
+
+        # Record the new position in the trail ring buffers
+        head = self._trail_head
+        self.trail_x[live, head] = self.x[live]
+        self.trail_y[live, head] = self.y[live]
+        alpha = np.maximum(0, 255 * self.lifetime[live] // self.max_lifetime)
+        self.trail_alpha[live, head] = (alpha * (ALPHA_BUCKETS - 1) + 127) // 255
+        np.minimum(self.trail_count[live] + 1, self.trail_length, out=self.trail_count[live])
+        self._trail_head = (head + 1) % self.trail_length
+
+        # Compact the survivors to the front in one step
+        alive = self.lifetime[live] > 0
+        survivors = int(np.count_nonzero(alive))
+        if survivors != n:
+            for array in self._arrays:
+                array[:survivors] = array[live][alive]
+            self.count = survivors
+
+    def draw(self, surface, alpha=1.0):
+        """
+        Draw every particle with its trail, bodies alpha of the way through
+        the last tick.
+        """
+        n = self.count
+        if n == 0:
+            return
+        if n > self.bulk_threshold and surface.get_bytesize() == 4:
+            self._scatter_trails(surface, n)
+        else:
+            self._blit_trails(surface, n)
+
+        # Bodies of circle particles
+        circles = np.flatnonzero(self.kind[:n] == CIRCLE)
+        sizes = self.size[circles]
+        sprite_index = sizes * len(self.palette) + self.color[circles]
+        x = self.previous_x[circles] + (self.x[circles] - self.previous_x[circles]) * alpha
+        y = self.previous_y[circles] + (self.y[circles] - self.previous_y[circles]) * alpha
+        left = x.astype(np.int32) - sizes
+        top = y.astype(np.int32) - sizes
+        surface.blits(zip(map(self._circle_sprites.__getitem__, sprite_index.tolist()),
+                          zip(left.tolist(), top.tolist())), doreturn=False)
+
+    def _blit_trails(self, surface, n):
+        """Draw trails as translucent circles fading with the particle's lifetime, oldest points first."""
+        columns = (self._trail_head - self.trail_length + np.arange(self.trail_length)) % self.trail_length
+        buckets = self.trail_alpha[:n][:, columns]
+        shown = np.minimum(self.trail_count[:n, None], self.visible_trail_length)
+        visible = (np.arange(self.trail_length) >= self.trail_length - shown) & (buckets > 0)
+        rows, steps = np.nonzero(visible)
+        trail_size = np.maximum(1, self.size[rows] // 2)
+        sprite_index = (trail_size * len(self.palette) + self.color[rows]) * ALPHA_BUCKETS + buckets[rows, steps]
+        left = self.trail_x[rows, columns[steps]].astype(np.int32) - trail_size
+        top = self.trail_y[rows, columns[steps]].astype(np.int32) - trail_size
+        surface.blits(zip(map(self._trail_sprites.__getitem__, sprite_index.tolist()),
+                          zip(left.tolist(), top.tolist())), doreturn=False)
+
+    def _scatter_trails(self, surface, n):
+        """Blend the newest trail points into a 32 bit surface as single pixels."""
+        width, height = surface.get_size()
+        shown = min(self.visible_trail_length, max(1, self.bulk_trail_points // n))
+        columns = (self._trail_head - 1 - np.arange(shown)) % self.trail_length
+        px = self.trail_x[:n, columns].astype(np.int32)
+        py = self.trail_y[:n, columns].astype(np.int32)
+        buckets = self.trail_alpha[:n, columns]
+        visible = ((np.arange(shown) < self.trail_count[:n, None]) & (buckets > 0) &
+                   (px >= 0) & (px < width) & (py >= 0) & (py < height))
+        rows, steps = np.nonzero(visible)
+        if len(rows) == 0:
+            return
+
+        # Blend each point's color over the pixel by its alpha bucket
+        stride = surface.get_pitch() // 4
+        index = py[rows, steps] * stride + px[rows, steps]
+        weight = buckets[rows, steps].astype(np.int32) * (256 // ALPHA_BUCKETS)
+        color = self._palette_rgb[self.color[rows]]
+        buffer = surface.get_buffer()
+        pixels = np.frombuffer(buffer, dtype=np.uint32)
+        old = pixels[index]
+        blended = old & np.uint32(surface.get_masks()[3])
+        for channel, shift in enumerate(surface.get_shifts()[:3]):
+            value = (old >> shift).astype(np.int32) & 255
+            value += (color[:, channel] - value) * weight >> 8
+            blended |= value.astype(np.uint32) << shift
+        pixels[index] = blended
+        del pixels, buffer  # Unlock the surface
+
+    def bounding_rect(self):
+        """Return a Rect covering every particle and trail point, or None."""
+        n = self.count
+        if n == 0:
+            return None
+        age = (self._trail_head - 1 - np.arange(self.trail_length)) % self.trail_length
+        valid = age < self.trail_count[:n, None]
+        margin = int(self.size[:n].max()) + 2
+        xs = np.concatenate((self.x[:n], self.previous_x[:n], self.trail_x[:n][valid]))
+        ys = np.concatenate((self.y[:n], self.previous_y[:n], self.trail_y[:n][valid]))
+        left = math.floor(float(xs.min())) - margin
+        top = math.floor(float(ys.min())) - margin
+        return pygame.Rect(left, top,
+                           math.ceil(float(xs.max())) + margin - left,
+                           math.ceil(float(ys.max())) + margin - top)
+
+    def _render_circle(self, size, color, alpha):
+        """Render a filled circle of the given radius, palette color and alpha."""
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*self.palette[color], alpha), (size, size), size)
+        return sprite
+
+
+class Particle:
+    """A pooled particle record (see ParticlePool)."""
+    __slots__ = ('x', 'y', 'vel_x', 'vel_y', 'size', 'color', 'lifetime', '_slot')
+
+
+class ParticlePool:
+    """
+    Fixed-capacity pool of Particle records.
+
+    Every record is created up front. acquire() pops one off the free list
+    and release() puts it back, swapping the last active record into its
+    place, so neither allocates or scans. Iterating visits active records
+    from the end, which keeps it safe to release the current record from
+    inside the loop.
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.records = [Particle() for _ in range(capacity)]
+        self.free = list(reversed(self.records))
+        self.active = []
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        active = self.active
+        for i in range(len(active) - 1, -1, -1):
+            yield active[i]
+
+    def acquire(self):
+        """Return a free record, or None if the pool is exhausted."""
+        if not self.free:
+            return None
+        record = self.free.pop()
+        record._slot = len(self.active)
+        self.active.append(record)
+        return record
+
+    def release(self, record):
+        """Return an active record to the free list."""
+        last = self.active.pop()
+        if last is not record:
+            self.active[record._slot] = last
+            last._slot = record._slot
+        self.free.append(record)
+
+    def clear(self):
+        """Release every record."""
+        self.free.extend(self.active)
+        self.active.clear()
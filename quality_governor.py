@@ -0,0 +1,71 @@
+"""
+Adaptive effect quality, to hold the frame rate on slow machines.
+
+The governor is fed each frame's work time (pygame's Clock.get_rawtime(),
+which leaves out the time spent waiting for the frame cap) and keeps a
+quality level from 0 to 1, held between min_quality and max_quality.
+Effects read their settings from it with scale(): at quality 0.5,
+scale(20, 100) particles is 60.
+
+Quality only moves when the average over a window of frames leaves a
+band around the frame budget: above high_water * budget it steps down,
+below low_water * budget it steps up. The gap between the two marks is
+the hysteresis that stops it flip-flopping at the edge. After a change
+the window restarts and nothing moves again for cooldown frames, so each
+decision is made on frames drawn at the new setting.
+"""
+from collections import deque
+
+
+class QualityGovernor:
+    def __init__(self, target_fps=60, min_quality=0.25, max_quality=1.0, step=0.25,
+                 high_water=0.9, low_water=0.6, window=30, cooldown=60):
+        if not 0 <= min_quality <= max_quality <= 1:
+            raise ValueError("need 0 <= min_quality <= max_quality <= 1")
+        if not 0 < low_water < high_water:
+            raise ValueError("need 0 < low_water < high_water")
+        self.budget_ms = 1000 / target_fps
+        self.min_quality = min_quality
+        self.max_quality = max_quality
+        self.step = step
+        self.high_water = high_water
+        self.low_water = low_water
+        self.window = window
+        self.cooldown = cooldown
+
+        self.quality = max_quality
+        self.changes = 0  # Total quality changes, for statistics
+        self._frames = deque(maxlen=window)
+        self._hold = 0  # Frames left before the next change is allowed
+
+    def record(self, frame_ms):
+        """
+        Record a frame's work time in milliseconds. Returns True if the
+        quality changed, in which case settings should be re-read.
+        """
+        if self._hold > 0:
+            self._hold -= 1
+            return False
+        self._frames.append(frame_ms)
+        if len(self._frames) < self.window:
+            return False
+
+        average = sum(self._frames) / len(self._frames)
+        if average > self.high_water * self.budget_ms:
+            quality = max(self.min_quality, self.quality - self.step)
+        elif average < self.low_water * self.budget_ms:
+            quality = min(self.max_quality, self.quality + self.step)
+        else:
+            return False
+        if quality == self.quality:
+            return False
+
+        self.quality = quality
+        self.changes += 1
+        self._frames.clear()
+        self._hold = self.cooldown
+        return True
+
+    def scale(self, low, high):
+        """Return the setting quality of the way from low (quality 0) to high (full quality)."""
+        return round(low + (high - low) * self.quality)
@@ -0,0 +1,65 @@
+import pygame
+
+class RenderPipeline:
+    """
+    Presents only the parts of the screen that changed.
+
+    Each frame, the drawing code marks the regions it animated (stars,
+    the hovered cell, symbols being drawn, particles, pulsing buttons).
+    present() pushes those regions, plus the ones marked last frame so
+    anything that moved away is erased on screen too, with
+    pygame.display.update(rects). It falls back to a full flip when asked
+    to (scene changes, fades) or when the dirty area is too large for
+    partial updates to pay off.
+    """
+    def __init__(self, screen_size, max_rects=600, max_area_fraction=0.5):
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.max_rects = max_rects
+        self.max_area = self.screen_rect.width * self.screen_rect.height * max_area_fraction
+
+        # Frame state
+        self.dirty_rects = []
+        self.previous_rects = []
+        self.full_redraw = True
+
+        # Statistics for the last presented frame
+        self.last_rect_count = 0
+        self.last_area = 0
+        self.last_was_full = True
+
+    def mark(self, rect):
+        """Mark a screen region (Rect or (x, y, w, h)) as changed this frame."""
+        rect = self.screen_rect.clip(pygame.Rect(rect))
+        if rect.width > 0 and rect.height > 0:
+            self.dirty_rects.append(rect)
+
+    def mark_all(self, rects):
+        """Mark several regions as changed this frame."""
+        for rect in rects:
+            self.mark(rect)
+
+    def request_full_redraw(self):
+        """Present the whole screen this frame (e.g. during transitions)."""
+        self.full_redraw = True
+
+    def present(self):
+        """Push this frame's changes to the display and start a new frame."""
+        rects = self.dirty_rects + self.previous_rects
+        area = sum(rect.width * rect.height for rect in rects)
+
+        if self.full_redraw or len(rects) > self.max_rects or area > self.max_area:
+            pygame.display.flip()
+            self.last_was_full = True
+            self.last_area = self.screen_rect.width * self.screen_rect.height
+            self.last_rect_count = 1
+        else:
+            if rects:
+                pygame.display.update(rects)
+            self.last_was_full = False
+            self.last_area = area
+            self.last_rect_count = len(rects)
+
+        # Regions drawn this frame need presenting again once they're erased
+        self.previous_rects = self.dirty_rects
+        self.dirty_rects = []
+        self.full_redraw = False
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+
+import pygame
+
+class SpriteCache:
+    """
+    Bounded LRU cache of pre-rendered translucent sprites.
+
+    Glows and hover highlights are plain shapes that only differ by size,
+    color (including alpha) and corner radius, and labels only by font,
+    text and color, so they're rendered once per key and reused. When the
+    cached pixels exceed max_bytes the least recently used sprites are
+    dropped.
+    """
+    def __init__(self, max_bytes=16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self._sprites = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def get(self, key, render):
+        """Return the sprite for key, calling render() to create it on a miss."""
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = render()
+        self._sprites[key] = sprite
+        self.bytes_used += sprite.get_pitch() * sprite.get_height()
+        # Evict the oldest sprites, but never the one just added
+        while self.bytes_used > self.max_bytes and len(self._sprites) > 1:
+            _, evicted = self._sprites.popitem(last=False)
+            self.bytes_used -= evicted.get_pitch() * evicted.get_height()
+            self.evictions += 1
+        return sprite
+
+    def circle(self, radius, color):
+        """Return a filled circle of the given radius and RGBA color."""
+        def render():
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            return sprite
+        return self.get(('circle', radius, tuple(color)), render)
+
+    def rect(self, width, height, color, border_radius=0):
+        """Return a filled (optionally rounded) rectangle in the given RGBA color."""
+        def render():
+            sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(sprite, color, (0, 0, width, height), border_radius=border_radius)
+            return sprite
+        return self.get(('rect', width, height, tuple(color), border_radius), render)
+
+    def text(self, font, text, antialias, color):
+        """Return font.render(text, antialias, color), rendering it only once."""
+        return self.get(('text', font, text, tuple(color), antialias),
+                        lambda: font.render(text, antialias, color))
+
+    def clear(self):
+        """Drop every sprite and reset the statistics."""
+        self._sprites.clear()
+        self.bytes_used = 0
+        self.hits = self.misses = self.evictions = 0
+
+
+_shared_cache = None
+
+
+def shared_cache():
+    """Return the sprite cache shared by all the effect modules."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = SpriteCache()
+    return _shared_cache
@@ -0,0 +1,143 @@
+import numpy as np
+import pygame
+
+class Starfield:
+    """
+    Drifting, twinkling background stars.
+
+    Star state lives in NumPy arrays and every star is rasterized in one
+    pass: each radius has a precomputed stencil of pixel offsets (the same
+    pixels pygame.draw.circle fills), so drawing is a single scattered
+    write into the surface's pixel array instead of a draw call per star.
+
+    update() advances one fixed simulation tick; draw() places each star
+    between its last two positions so motion stays smooth whatever the
+    frame rate.
+    """
+    def __init__(self, width, height, count=200, min_size=1, max_size=4, seed=None):
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+
+        self.x = self.rng.integers(0, width + 1, count).astype(np.float32)
+        self.y = self.rng.integers(0, height + 1, count).astype(np.float32)
+        self.previous_y = self.y.copy()  # Before the last update(), for interpolation
+        self.size = self.rng.integers(min_size, max_size + 1, count)
+        self.speed = self.rng.uniform(0.1, 0.8, count).astype(np.float32)
+        self.twinkle = self.rng.random(count).astype(np.float32)
+        # How many of the stars are drawn (see QualityGovernor); all of them
+        # keep moving so they reappear where they would have been
+        self.visible_count = count
+
+        # Pixel offsets for each radius, padded to the largest stencil by
+        # repeating the center pixel (writing it twice is harmless)
+        stencils = [self._circle_pixels(size) or [(0, 0)] for size in range(max_size + 1)]
+        longest = max(len(pixels) for pixels in stencils)
+        self._stencil_x = np.zeros((max_size + 1, longest), dtype=np.int32)
+        self._stencil_y = np.zeros((max_size + 1, longest), dtype=np.int32)
+        for size, pixels in enumerate(stencils):
+            self._stencil_x[size, :len(pixels)] = [dx for dx, dy in pixels]
+            self._stencil_y[size, :len(pixels)] = [dy for dx, dy in pixels]
+        self._flat_stencils = {}  # Row stride -> stencils as flat buffer offsets
+        self._drawn_y = None  # Rows of the last draw(), for dirty_rects()
+
+    def __len__(self):
+        """The number of stars drawn."""
+        return min(self.visible_count, len(self.x))
+
+    def update(self):
+        """Drift the stars down the screen and advance their twinkle by one tick."""
+        self.previous_y[:] = self.y
+        self.y += self.speed
+        wrapped = self.y > self.height
+        if wrapped.any():
+            self.y[wrapped] = 0
+            self.previous_y[wrapped] = 0  # Don't sweep back up the screen
+            self.x[wrapped] = self.rng.integers(0, self.width + 1, int(wrapped.sum()))
+        self.twinkle += 0.02  # Faster twinkling
+        self.twinkle %= 1.0
+
+    def colors(self):
+        """Return the (N, 3) uint8 color of every star this frame."""
+        phase = self.twinkle * np.pi
+        # Cycle through colors
+        base = np.stack((
+            180 + (75 * np.abs(np.sin(phase))).astype(np.int32),
+            180 + (75 * np.abs(np.sin(phase + 2))).astype(np.int32),
+            200 + (55 * np.abs(np.sin(phase + 4))).astype(np.int32),
+        ), axis=1)
+        brightness = np.abs(np.sin(phase * 2))
+        return (base * brightness[:, None]).astype(np.uint8)
+
+    def draw(self, surface, alpha=1.0):
+        """
+        Rasterize every star onto a 24 or 32 bit surface, alpha of the way
+        from its previous position to its current one.
+        """
+        width, height = surface.get_size()
+        n = len(self)
+        x = self.x[:n].astype(np.int32)
+        y = (self.previous_y[:n] + (self.y[:n] - self.previous_y[:n]) * alpha).astype(np.int32)
+        self._drawn_y = y
+        colors = self.colors()[:n]
+
+        if surface.get_bytesize() != 4:
+            pixels = pygame.surfarray.pixels3d(surface)
+            px, py, star = self._clipped_pixels(x, y, np.arange(len(x)), width, height)
+            pixels[px, py] = colors[star]
+            del pixels  # Unlock the surface
+            return
+
+        # Map colors to pixel values once per star
+        r_shift, g_shift, b_shift, _ = surface.get_shifts()
+        colors = colors.astype(np.uint32)
+        mapped = colors[:, 0] << r_shift | colors[:, 1] << g_shift | colors[:, 2] << b_shift
+        mapped |= np.uint32(surface.get_masks()[3])  # Opaque on surfaces with alpha
+
+        # Write through a flat view of the pixel buffer
+        stride = surface.get_pitch() // 4
+        stencils = self._flat_stencils.get(stride)
+        if stencils is None:
+            stencils = self._stencil_y * stride + self._stencil_x
+            self._flat_stencils[stride] = stencils
+        buffer = surface.get_buffer()
+        pixels = np.frombuffer(buffer, dtype=np.uint32)
+
+        # Stars clear of the edges need no clipping: one scattered write
+        size = self.size[:n]
+        inside = (x >= size) & (x + size < width) & (y >= size) & (y + size < height)
+        pixels[(y * stride + x)[inside, None] + stencils[size[inside]]] = mapped[inside, None]
+
+        # The few that overlap an edge are clipped pixel by pixel
+        edge = np.flatnonzero(~inside)
+        if len(edge):
+            px, py, star = self._clipped_pixels(x[edge], y[edge], edge, width, height)
+            pixels[py * stride + px] = mapped[star]
+        del pixels, buffer  # Unlock the surface
+
+    def _clipped_pixels(self, x, y, stars, width, height):
+        """Return the on-screen (px, py, star index) of every pixel of the given stars."""
+        size = self.size[stars]
+        px = x[:, None] + self._stencil_x[size]
+        py = y[:, None] + self._stencil_y[size]
+        visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        return px[visible], py[visible], np.broadcast_to(stars[:, None], px.shape)[visible]
+
+    def dirty_rects(self):
+        """Return the (x, y, w, h) area of every star as last drawn."""
+        n = len(self)
+        y = self._drawn_y if self._drawn_y is not None else self.y.astype(np.int32)
+        size = self.size[:n]
+        left = self.x[:n].astype(np.int32) - size - 1
+        top = y[:n] - size - 1
+        side = size * 2 + 3
+        return list(zip(left.tolist(), top.tolist(), side.tolist(), side.tolist()))
+
+    @staticmethod
+    def _circle_pixels(radius):
+        """Return the (dx, dy) offsets pygame.draw.circle fills for a radius."""
+        side = radius * 2 + 1
+        stencil = pygame.Surface((side, side))
+        pygame.draw.circle(stencil, (255, 255, 255), (radius, radius), radius)
+        mask = pygame.surfarray.array_red(stencil)
+        return [(x - radius, y - radius) for x, y in zip(*np.nonzero(mask))]
@@ -0,0 +1,78 @@
+"""
+Symmetry canonicalization for 3x3 bitboards.
+
+The board has 8 symmetries (4 rotations, each optionally mirrored).
+Positions that are rotations or reflections of each other share a
+canonical form, so caches keyed on it need roughly an eighth of the
+entries. Everything is precomputed into permutation tables over 9-bit
+masks, so canonicalizing a position is 16 tuple lookups.
+"""
+from bitboard import BOARD_CELLS, CELL_COORDS, FULL_MASK, SET_CELLS
+
+
+def _cell_maps():
+    """Where each transform sends cell (row, col)."""
+    return (
+        lambda r, c: (r, c),          # identity
+        lambda r, c: (c, 2 - r),      # rotate 90 clockwise
+        lambda r, c: (2 - r, 2 - c),  # rotate 180
+        lambda r, c: (2 - c, r),      # rotate 270 clockwise
+        lambda r, c: (r, 2 - c),      # mirror left-right
+        lambda r, c: (2 - r, c),      # mirror top-bottom
+        lambda r, c: (c, r),          # transpose (main diagonal)
+        lambda r, c: (2 - c, 2 - r),  # anti-transpose (other diagonal)
+    )
+
+
+# PERMUTATIONS[t][cell] is the cell that `cell` moves to under transform t
+PERMUTATIONS = tuple(
+    tuple(row * 3 + col for row, col in (cell_map(*CELL_COORDS[i]) for i in range(BOARD_CELLS)))
+    for cell_map in _cell_maps()
+)
+TRANSFORM_COUNT = len(PERMUTATIONS)
+
+# INVERSE[t] is the transform that undoes t
+INVERSE = tuple(
+    next(u for u in range(TRANSFORM_COUNT)
+         if all(PERMUTATIONS[u][PERMUTATIONS[t][i]] == i for i in range(BOARD_CELLS)))
+    for t in range(TRANSFORM_COUNT)
+)
+
+# TRANSFORMED[t][bits] is a 9-bit mask with transform t applied
+TRANSFORMED = tuple(
+    tuple(sum(1 << perm[i] for i in SET_CELLS[bits]) for bits in range(FULL_MASK + 1))
+    for perm in PERMUTATIONS
+)
+
+
+def canonical(a, b):
+    """
+    Return (a', b', t) where (a', b') is the canonical form of the pair of
+    masks (a, b) and t is the transform that maps (a, b) onto it. The
+    canonical form is the transformed pair with the smallest a' | b' << 9.
+    """
+    best_key = a | b << 9
+    best_t = 0
+    for t in range(1, TRANSFORM_COUNT):
+        table = TRANSFORMED[t]
+        key = table[a] | table[b] << 9
+        if key < best_key:
+            best_key = key
+            best_t = t
+    return best_key & FULL_MASK, best_key >> 9, best_t
+
+
+def canonical_key(a, b):
+    """Return (key, t): the canonical pair packed as a' | b' << 9, and its transform."""
+    ca, cb, t = canonical(a, b)
+    return ca | cb << 9, t
+
+
+def to_canonical_cell(cell, t):
+    """Map a cell index into the canonical frame of transform t."""
+    return PERMUTATIONS[t][cell]
+
+
+def from_canonical_cell(cell, t):
+    """Map a cell index from the canonical frame of transform t back to the board."""
+    return PERMUTATIONS[INVERSE[t]][cell]
@@ -0,0 +1,114 @@
+"""
+Headless self-play between two AIPlayer strategies.
+
+Games are split into chunks that run in a process pool. Each chunk seeds
+its own RNG, plays its games with no thinking delay and sends back only
+its totals, which are merged and printed as chunks finish.
+
+Usage:
+    python tournament.py easy hard --games 1000000
+    python tournament.py medium hard --size 5 --win-length 4 --games 200
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ai_player import AIPlayer
+from bitboard import get_geometry
+from game_state import GameState
+from mcts import MCTSEngine
+
+STRATEGIES = ('easy', 'medium', 'hard', 'mcts')
+
+
+def play_game(player_x, player_o, geometry):
+    """Play one game to the end. Returns (winning symbol or None, moves made)."""
+    state = GameState(geometry)
+    players = ((player_x, 'X'), (player_o, 'O'))
+    turn = 0
+    while True:
+        player, symbol = players[turn]
+        row, col = player.choose_move(state.bitboard)
+        result = state.place(row, col, symbol)
+        if result.game_over:
+            return result.winner, state.moves_made
+        turn ^= 1
+
+
+def play_chunk(strategy_a, strategy_b, first_game, games, seed, size, win_length, time_budget):
+    """
+    Play games first_game .. first_game + games - 1, alternating which
+    strategy moves first. Returns (a_wins, b_wins, draws, total_moves).
+    """
+    # Seed from the chunk's position so results don't depend on scheduling
+    random.seed(seed * 1000003 + first_game)
+    geometry = get_geometry(size, win_length)
+    # The tournament is already spread over processes, so MCTS runs inline
+    if AIPlayer.mcts_engine is None:
+        AIPlayer.mcts_engine = MCTSEngine(workers=1)
+    player_a = AIPlayer(strategy_a, think_time=0, time_budget=time_budget)
+    player_b = AIPlayer(strategy_b, think_time=0, time_budget=time_budget)
+    a_wins = b_wins = draws = total_moves = 0
+    for game in range(first_game, first_game + games):
+        a_is_x = game % 2 == 0
+        if a_is_x:
+            winner, moves = play_game(player_a, player_b, geometry)
+        else:
+            winner, moves = play_game(player_b, player_a, geometry)
+        total_moves += moves
+        if winner is None:
+            draws += 1
+        elif (winner == 'X') == a_is_x:
+            a_wins += 1
+        else:
+            b_wins += 1
+    return a_wins, b_wins, draws, total_moves
+
+
+def run(strategy_a, strategy_b, games, workers=None, chunk_size=10000, seed=0,
+        size=3, win_length=None, time_budget=0.1, output=sys.stdout):
+    """Play the tournament, printing running totals. Returns the final totals."""
+    workers = workers or os.cpu_count() or 1
+    chunks = [(first, min(chunk_size, games - first)) for first in range(0, games, chunk_size)]
+    totals = [0, 0, 0, 0]
+    played = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(play_chunk, strategy_a, strategy_b, first, count, seed,
+                               size, win_length, time_budget)
+                   for first, count in chunks]
+        for future in as_completed(futures):
+            for i, value in enumerate(future.result()):
+                totals[i] += value
+            played = totals[0] + totals[1] + totals[2]
+            elapsed = time.perf_counter() - start
+            print(f"{played:>10} games | {strategy_a} wins {totals[0] / played:6.2%} | "
+                  f"{strategy_b} wins {totals[1] / played:6.2%} | draws {totals[2] / played:6.2%} | "
+                  f"avg length {totals[3] / played:4.2f} | {played / elapsed:9.0f} games/s",
+                  file=output, flush=True)
+    return tuple(totals)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play two AI strategies against each other.")
+    parser.add_argument('strategy_a', choices=STRATEGIES)
+    parser.add_argument('strategy_b', choices=STRATEGIES)
+    parser.add_argument('--games', type=int, default=100000)
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument('--chunk-size', type=int, default=10000, help="games per task")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--size', type=int, default=3, help="cells per side")
+    parser.add_argument('--win-length', type=int, default=None, help="pieces in a row to win")
+    parser.add_argument('--time-budget', type=float, default=0.1,
+                        help="seconds per move for searches on large boards and mcts")
+    args = parser.parse_args(argv)
+    run(args.strategy_a, args.strategy_b, args.games, args.workers, args.chunk_size,
+        args.seed, args.size, args.win_length, args.time_budget)
+
+
+if __name__ == "__main__":
+    main()